@@ -1,31 +1,19 @@
 """Entry point for GIMS MCP Server."""
 
-import argparse
-import asyncio
-import logging
 import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 from .config import Config
-from .server import run_server
 
+if TYPE_CHECKING:
+    import argparse
 
-def _parse_verify_ssl(value: str) -> bool:
-    """Parse --verify-ssl argument value."""
-    if value.lower() in ("false", "0", "no", "off"):
-        return False
-    if value.lower() in ("true", "1", "yes", "on"):
-        return True
-    raise argparse.ArgumentTypeError(
-        f"Invalid value '{value}'. Use 'true', 'false', '1', '0', 'yes', 'no', 'on', or 'off'."
-    )
+_DESCRIPTION = "GIMS Automation MCP Server"
 
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="GIMS Automation MCP Server",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Environment variables:
   GIMS_URL                   URL of the GIMS server (e.g., https://gims.example.com)
   GIMS_ACCESS_TOKEN          JWT access token for authentication
@@ -39,56 +27,120 @@ Examples:
   gims-mcp-server --url https://gims.example.com --access-token eyJ... --refresh-token eyJ... --verify-ssl false
   gims-mcp-server --max-response-size 20  # Increase limit to 20KB (~5000 tokens)
   GIMS_URL=https://gims.example.com GIMS_ACCESS_TOKEN=eyJ... GIMS_REFRESH_TOKEN=eyJ... gims-mcp-server
-        """,
-    )
-    parser.add_argument(
-        "--url",
-        help="GIMS server URL (or set GIMS_URL env var)",
-    )
-    parser.add_argument(
-        "--access-token",
-        help="JWT access token (or set GIMS_ACCESS_TOKEN env var)",
-    )
-    parser.add_argument(
-        "--refresh-token",
-        help="JWT refresh token for automatic renewal (or set GIMS_REFRESH_TOKEN env var)",
-    )
-    parser.add_argument(
-        "--verify-ssl",
-        type=_parse_verify_ssl,
-        metavar="BOOL",
-        help="Verify SSL certificates (true/false, default: true). Use 'false' for self-signed certificates.",
-    )
-    parser.add_argument(
-        "--max-response-size",
-        type=int,
-        metavar="KB",
-        help="Maximum response size in kilobytes (default: 10). "
-             "Approximate token conversion: 1KB ~ 250 tokens (ASCII) or 170 tokens (Cyrillic). "
-             "Example: 10KB ~ 2500 tokens, 20KB ~ 5000 tokens.",
-    )
-    parser.add_argument(
-        "--log-stream-timeout",
-        type=int,
-        metavar="SECONDS",
-        help="Log stream timeout in seconds (default: 60). "
-             "Maximum time to wait for script execution log via SSE.",
-    )
-    parser.add_argument(
-        "--debug",
-        action="store_true",
-        help="Enable debug logging",
-    )
+"""
+
+# Command line options: flag -> add_argument() keyword arguments.
+# Shared by the fast-path scanner and the full argparse parser.
+_OPTIONS = {
+    "--url": {
+        "help": "GIMS server URL (or set GIMS_URL env var)",
+    },
+    "--access-token": {
+        "help": "JWT access token (or set GIMS_ACCESS_TOKEN env var)",
+    },
+    "--refresh-token": {
+        "help": "JWT refresh token for automatic renewal (or set GIMS_REFRESH_TOKEN env var)",
+    },
+    "--verify-ssl": {
+        "metavar": "BOOL",
+        "help": "Verify SSL certificates (true/false, default: true). Use 'false' for self-signed certificates.",
+    },
+    "--max-response-size": {
+        "type": int,
+        "metavar": "KB",
+        "help": "Maximum response size in kilobytes (default: 10). "
+                "Approximate token conversion: 1KB ~ 250 tokens (ASCII) or 170 tokens (Cyrillic). "
+                "Example: 10KB ~ 2500 tokens, 20KB ~ 5000 tokens.",
+    },
+    "--log-stream-timeout": {
+        "type": int,
+        "metavar": "SECONDS",
+        "help": "Log stream timeout in seconds (default: 60). "
+                "Maximum time to wait for script execution log via SSE.",
+    },
+    "--debug": {
+        "action": "store_true",
+        "help": "Enable debug logging",
+    },
+}
 
-    args = parser.parse_args()
 
-    # Configure logging
-    log_level = logging.DEBUG if args.debug else logging.WARNING
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        stream=sys.stderr,
+def _dest(flag: str) -> str:
+    """Return the namespace attribute name for a command line flag."""
+    return flag[2:].replace("-", "_")
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the full argument parser (used for --help and error reporting)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
+    for flag, kwargs in _OPTIONS.items():
+        parser.add_argument(flag, **kwargs)
+    return parser
+
+
+def _scan_args(argv: list[str]) -> SimpleNamespace | None:
+    """Parse command line arguments without building the argparse parser.
+
+    Handles the documented flat flag set (``--key value``, ``--key=value`` and
+    boolean switches). Returns None for anything else (``-h``, unknown or
+    abbreviated flags, missing or invalid values) so the caller can fall back
+    to the full parser, which produces help text and error messages.
+
+    Keeps argparse (and its gettext/re/textwrap imports) off the normal
+    startup path.
+    """
+    values = {
+        _dest(flag): False if kwargs.get("action") == "store_true" else None
+        for flag, kwargs in _OPTIONS.items()
+    }
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        kwargs = _OPTIONS.get(arg)
+        if kwargs is not None and kwargs.get("action") == "store_true":
+            values[_dest(arg)] = True
+            continue
+
+        flag, sep, value = arg.partition("=")
+        kwargs = _OPTIONS.get(flag)
+        if kwargs is None or kwargs.get("action") == "store_true":
+            return None
+        if not sep:
+            if i >= len(argv) or argv[i].startswith("-"):
+                return None
+            value = argv[i]
+            i += 1
+
+        convert = kwargs.get("type", str)
+        try:
+            values[_dest(flag)] = convert(value)
+        except ValueError:
+            # Conversion errors are reported by argparse
+            return None
+
+    return SimpleNamespace(**values)
+
+
+def main():
+    """Main entry point."""
+    args = _scan_args(sys.argv[1:])
+    if args is None:
+        args = _build_parser().parse_args()
+
+    # Configure logging. Without --debug no handler is installed: the logging
+    # module's last-resort handler already writes warnings and errors to stderr.
+    if args.debug:
+        import logging
+
+        logging.basicConfig(level=logging.DEBUG, format=_LOG_FORMAT, stream=sys.stderr)
 
     try:
         config = Config.from_args(
@@ -103,8 +155,16 @@ Examples:
         print(f"Configuration error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Run the server
-    asyncio.run(run_server(config))
+    # Run the server (imported late: the MCP stack is only needed once config is valid)
+    from .server import run_server
+
+    # Use the libuv-based event loop when available (optional "speedups" extra)
+    try:
+        from uvloop import run
+    except ImportError:
+        from asyncio import run
+
+    run(run_server(config))
 
 
 if __name__ == "__main__":
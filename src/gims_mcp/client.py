@@ -1,13 +1,103 @@
 """HTTP client for GIMS Automation API."""
 
+import asyncio
+import json
+import re
 import time
 from collections.abc import AsyncIterator
 from typing import Any
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
 
 import httpx
 
 from .config import Config
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Headers for requests carrying a JSON body
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Query parameter representation of booleans
+_BOOL_STR = {True: "true", False: "false"}
+
+# Connection attempts retried by the transport on connect errors
+CONNECT_RETRIES = 3
+
+# Gateway errors worth retrying for idempotent requests, with exponential backoff
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+TRANSIENT_RETRIES = 2
+RETRY_BACKOFF = 0.5
+
+# Read timeout for SSE streams: small enough to check the overall timeout regularly
+# (logviewer sends keepalive every 10s, so 5s ensures we check twice per keepalive interval)
+_SSE_READ_TIMEOUT = 5.0
+
+# Fixed (message, detail) reported for these error statuses, whatever the response body
+_STATUS_ERRORS = {
+    401: ("Authentication failed", "Token may be expired or invalid"),
+    403: ("Permission denied", "Insufficient permissions for this operation"),
+    404: ("Not found", "The requested resource was not found"),
+}
+
+# Detection of HTML error pages (Nginx/Django) in error responses
+_HTML_PREFIXES = ("<!DOCTYPE", "<html", "<HTML")
+_HTML_TITLE_RE = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+_ERROR_HEAD_BYTES = 2048
+
+# Reference data (value types, property sections) changes rarely; cache it for this long
+REFERENCE_CACHE_TTL = 300.0
+
+# Code for new activator types created without any
+DEFAULT_ACTIVATOR_CODE = "# Print all built-in variables and functions for help\nprint_help()"
+
+# Folder and type lists are cached briefly so back-to-back tool calls share one fetch;
+# changes made through this client drop the entry immediately
+LIST_CACHE_TTL = 5.0
+
+
+def _drop_none(**fields: Any) -> dict:
+    """Build a request body from keyword arguments, omitting those set to None."""
+    return {k: v for k, v in fields.items() if v is not None}
+
+
+def _environment_proxy(url: str) -> str | None:
+    """Return the proxy configured for url (HTTP(S)_PROXY/ALL_PROXY), or None if unset or bypassed by NO_PROXY."""
+    parts = urlsplit(url)
+    if not parts.hostname or proxy_bypass(parts.hostname):
+        return None
+    proxies = getproxies()
+    return proxies.get(parts.scheme) or proxies.get("all")
+
+
+class _AsyncByteReader:
+    """Minimal async file-like wrapper over a byte iterator, as expected by ijson."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the file type with read(0); don't consume a chunk for it
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
 
 class GimsApiError(Exception):
     """Exception raised when GIMS API returns an error."""
@@ -31,102 +121,165 @@ class GimsClient:
     def __init__(self, config: Config):
         self.config = config
         self.base_url = f"{config.url}/automation"
+        self._refresh_url = f"{config.url}/security/token/refresh/"
         self._access_token = config.access_token
         self._refresh_token = config.refresh_token
+        # Default headers of the API client, kept in sync with the access token
+        self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+        # Built once: loading the CA bundle is the expensive part of creating a client
+        self._ssl_context = httpx.create_ssl_context(verify=config.verify_ssl)
+        self._limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
         self._client: httpx.AsyncClient | None = None
+        self._sse_client: httpx.AsyncClient | None = None
+        # Bounds in-flight API requests (SSE streams are long-lived and not counted)
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        # url -> (expiry time, response) for reference endpoints
+        self._reference_cache: dict[str, tuple[float, Any]] = {}
+        # Single-flights token refresh: concurrent 401s must not spend the refresh token twice
+        self._refresh_lock = asyncio.Lock()
+
+    def _build_transport(self, proxy: str | None = None) -> httpx.AsyncHTTPTransport:
+        """Create a pooled HTTP/2 transport with connect retries, optionally through a proxy."""
+        return httpx.AsyncHTTPTransport(
+            verify=self._ssl_context,
+            http2=True,
+            limits=self._limits,
+            retries=CONNECT_RETRIES,
+            proxy=proxy,
+        )
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self._access_token}",
-                    "Content-Type": "application/json",
-                },
-                timeout=self.config.timeout,
-                verify=self.config.verify_ssl,
-            )
-        return self._client
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create the API HTTP client with the current access token.
 
-    async def _recreate_client(self) -> httpx.AsyncClient:
-        """Close and recreate HTTP client with updated token."""
-        if self._client is not None and not self._client.is_closed:
-            await self._client.aclose()
-        self._client = httpx.AsyncClient(
+        httpx ignores HTTP(S)_PROXY/NO_PROXY once a custom transport is given, so
+        the environment proxy for the GIMS host is applied to the transport here.
+        """
+        return httpx.AsyncClient(
             base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self._access_token}",
-                "Content-Type": "application/json",
-            },
+            headers=self._auth_headers,
             timeout=self.config.timeout,
-            verify=self.config.verify_ssl,
+            transport=self._build_transport(_environment_proxy(self.base_url)),
         )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client.
+
+        The client is only closed through close(), which resets it, so no
+        is_closed check is needed here.
+        """
+        if self._client is None:
+            self._client = self._build_client()
         return self._client
 
+    def _get_sse_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client for SSE streams, kept open across reconnects."""
+        if self._sse_client is None:
+            self._sse_client = httpx.AsyncClient(
+                # Relative log URLs are resolved against the GIMS URL (path prefix kept); absolute ones bypass it
+                base_url=self.config.url,
+                headers={**self._auth_headers, "Accept": "text/event-stream"},
+                timeout=httpx.Timeout(_SSE_READ_TIMEOUT, connect=10.0),
+                verify=self._ssl_context,
+                limits=self._limits,
+            )
+        return self._sse_client
+
+    async def __aenter__(self) -> "GimsClient":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
+        if self._sse_client is not None and not self._sse_client.is_closed:
+            await self._sse_client.aclose()
+            self._sse_client = None
 
-    async def _refresh_access_token(self) -> None:
+    async def _refresh_access_token(self, stale_token: str | None = None) -> None:
         """Refresh the access token using the refresh token.
 
+        Only one refresh runs at a time. Pass the access token the failed request
+        was sent with as stale_token: if another request has already replaced it
+        by the time the lock is acquired, no new refresh is made.
+
         Raises:
             GimsAuthError: If refresh token is expired or invalid.
             GimsApiError: If token refresh fails for other reasons.
         """
-        refresh_url = f"{self.config.url}/security/token/refresh/"
+        async with self._refresh_lock:
+            if stale_token is not None and stale_token != self._access_token:
+                return
+            await self._request_access_token()
+
+    async def _request_access_token(self) -> None:
+        """POST the refresh token and store the returned tokens."""
+        # Same host as the API: reuse the pooled client (the absolute URL bypasses base_url)
+        client = self._get_client()
+        request = client.build_request(
+            "POST", self._refresh_url, content=_json_dumps({"refresh": self._refresh_token}), headers=_JSON_HEADERS
+        )
+        # The expired access token must not be sent along with the refresh token
+        del request.headers["Authorization"]
+        try:
+            response = await client.send(request)
+        except httpx.RequestError as e:
+            raise GimsApiError(
+                0,
+                "Ошибка аутентификации: не удалось обновить токен доступа",
+                f"Ошибка сети: {e}",
+            ) from e
 
-        async with httpx.AsyncClient(
-            timeout=self.config.timeout,
-            verify=self.config.verify_ssl,
-        ) as client:
+        if response.status_code == 401:
+            raise GimsAuthError(
+                401,
+                "Ошибка аутентификации: токен обновления недействителен. "
+                "Проверьте учётную запись и получите новые токены в GIMS.",
+            )
+
+        if response.status_code != 200:
             try:
-                response = await client.post(
-                    refresh_url,
-                    json={"refresh": self._refresh_token},
-                    headers={"Content-Type": "application/json"},
-                )
-            except httpx.RequestError as e:
-                raise GimsApiError(
-                    0,
-                    "Ошибка аутентификации: не удалось обновить токен доступа",
-                    f"Ошибка сети: {e}",
-                )
+                data = _json_loads(response.content)
+                detail = data.get("detail") or _json_dumps(data).decode()
+            except Exception:
+                detail = response.text
+            raise GimsApiError(
+                response.status_code,
+                "Ошибка аутентификации: не удалось обновить токен доступа",
+                detail,
+            )
 
-            if response.status_code == 401:
-                raise GimsAuthError(
-                    401,
-                    "Ошибка аутентификации: токен обновления недействителен. "
-                    "Проверьте учётную запись и получите новые токены в GIMS.",
-                )
+        try:
+            data = _json_loads(response.content)
+            self._set_access_token(data["access"])
+            # refresh token is optional (only returned if ROTATE_REFRESH_TOKENS is True)
+            if "refresh" in data:
+                self._refresh_token = data["refresh"]
+        except (KeyError, ValueError) as e:
+            raise GimsApiError(
+                response.status_code,
+                "Ошибка аутентификации: не удалось обновить токен доступа",
+                f"Неверный формат ответа: {e}",
+            ) from e
 
-            if response.status_code != 200:
-                try:
-                    data = response.json()
-                    detail = data.get("detail", str(data))
-                except Exception:
-                    detail = response.text
-                raise GimsApiError(
-                    response.status_code,
-                    "Ошибка аутентификации: не удалось обновить токен доступа",
-                    detail,
-                )
+    def _set_access_token(self, access_token: str) -> None:
+        """Store a new access token and update the existing clients' headers in place.
 
-            try:
-                data = response.json()
-                self._access_token = data["access"]
-                # refresh token is optional (only returned if ROTATE_REFRESH_TOKENS is True)
-                if "refresh" in data:
-                    self._refresh_token = data["refresh"]
-            except (KeyError, ValueError) as e:
-                raise GimsApiError(
-                    response.status_code,
-                    "Ошибка аутентификации: не удалось обновить токен доступа",
-                    f"Неверный формат ответа: {e}",
-                )
+        Updating in place (rather than recreating clients) keeps pooled connections open.
+        """
+        self._access_token = access_token
+        self._auth_headers["Authorization"] = f"Bearer {access_token}"
+        for client in (self._client, self._sse_client):
+            if client is not None:
+                client.headers.update(self._auth_headers)
 
     def _handle_response(self, response: httpx.Response) -> Any:
         """Handle API response, raising errors if needed.
@@ -134,65 +287,71 @@ class GimsClient:
         Note: 401 errors should be handled by the request wrapper, not here.
         Filters non-JSON responses to prevent garbage in LLM context.
         """
-        if response.status_code == 401:
-            raise GimsApiError(401, "Authentication failed", "Token may be expired or invalid")
-        if response.status_code == 403:
-            raise GimsApiError(403, "Permission denied", "Insufficient permissions for this operation")
-        if response.status_code == 404:
-            raise GimsApiError(404, "Not found", "The requested resource was not found")
-        if response.status_code >= 400:
-            try:
-                data = response.json()
-                detail = data.get("detail", str(data))
-            except Exception:
-                detail = self._sanitize_error_response(response)
-            raise GimsApiError(response.status_code, "API error", detail)
+        status_code = response.status_code
+        content_type = response.headers.get("content-type", "")
 
-        if response.status_code == 204:
-            return None
+        if status_code < 400:
+            # No Content / Reset Content, or an empty body (e.g. DELETE answered with 200)
+            if status_code in (204, 205) or not response.content:
+                return None
 
-        # Validate Content-Type to prevent non-JSON garbage in LLM context
-        content_type = response.headers.get("content-type", "")
-        if "application/json" not in content_type:
-            raise GimsApiError(
-                response.status_code,
-                "Invalid response format",
-                f"Expected JSON (application/json), got '{content_type}'. "
-                "Server may have returned an error page. Response body filtered.",
-            )
+            # Validate Content-Type to prevent non-JSON garbage in LLM context
+            if "application/json" not in content_type:
+                raise GimsApiError(
+                    status_code,
+                    "Invalid response format",
+                    f"Expected JSON (application/json), got '{content_type}'. "
+                    "Server may have returned an error page. Response body filtered.",
+                )
 
-        try:
-            return response.json()
-        except Exception as e:
-            raise GimsApiError(
-                response.status_code,
-                "Failed to parse JSON response",
-                f"Content-Type was '{content_type}' but body is not valid JSON: {e}",
-            )
+            try:
+                return _json_loads(response.content)
+            except Exception as e:
+                raise GimsApiError(
+                    status_code,
+                    "Failed to parse JSON response",
+                    f"Content-Type was '{content_type}' but body is not valid JSON: {e}",
+                )
+
+        known_error = _STATUS_ERRORS.get(status_code)
+        if known_error is not None:
+            raise GimsApiError(status_code, *known_error)
+
+        detail = None
+        # Only try to decode bodies that claim to be JSON (HTML error pages are common here)
+        if "json" in content_type:
+            try:
+                data = _json_loads(response.content)
+                detail = data.get("detail") or _json_dumps(data).decode()
+            except Exception:
+                pass
+        if detail is None:
+            detail = self._sanitize_error_response(response)
+        raise GimsApiError(status_code, "API error", detail)
 
     def _sanitize_error_response(self, response: httpx.Response) -> str:
         """Sanitize error response to prevent HTML/garbage in LLM context.
 
         Returns a clean error message instead of raw HTML or large text.
+        Only the start of the body is decoded unless it is short enough to return as is.
         """
         content_type = response.headers.get("content-type", "")
-        text = response.text
+        content = response.content
+        head = content[:_ERROR_HEAD_BYTES].decode("utf-8", "replace")
 
         # If it's HTML (error page from Nginx/Django), don't return the full content
-        if "text/html" in content_type or text.strip().startswith(("<!DOCTYPE", "<html", "<HTML")):
-            # Try to extract title from HTML
-            import re
-
-            title_match = re.search(r"<title[^>]*>([^<]+)</title>", text, re.IGNORECASE)
+        if "text/html" in content_type or head.lstrip().startswith(_HTML_PREFIXES):
+            # Try to extract title from HTML (it is in <head>, near the start)
+            title_match = _HTML_TITLE_RE.search(head)
             if title_match:
                 return f"Server returned HTML error page: {title_match.group(1).strip()}"
             return "Server returned HTML error page (content filtered)"
 
         # For other non-JSON responses, truncate if too long
-        if len(text) > 500:
-            return f"{text[:500]}... (truncated, {len(text)} bytes total)"
+        if len(content) > 500:
+            return f"{content[:500].decode('utf-8', 'ignore')}... (truncated, {len(content)} bytes total)"
 
-        return text
+        return response.text
 
     async def _request(
         self,
@@ -211,25 +370,129 @@ class GimsClient:
             params: Query parameters.
 
         Returns:
-            Parsed JSON response or None for 204.
+            Parsed JSON response, or None for 204/205 and empty bodies.
 
         Raises:
             GimsAuthError: If authentication fails and cannot be recovered.
             GimsApiError: For other API errors.
         """
-        client = await self._get_client()
+        client = self._get_client()
+        # Encode the body once (it is reused if the request is retried)
+        content = _json_dumps(json) if json is not None else None
+        headers = _JSON_HEADERS if content is not None else None
+
+        retries = TRANSIENT_RETRIES if method in _IDEMPOTENT_METHODS else 0
 
         # First attempt
-        response = await client.request(method, url, json=json, params=params)
+        token = self._access_token
+        response = await self._send(client, method, url, retries, content=content, params=params, headers=headers)
 
         # If 401, try to refresh token and retry
         if response.status_code == 401:
-            await self._refresh_access_token()
-            client = await self._recreate_client()
-            response = await client.request(method, url, json=json, params=params)
+            await self._refresh_access_token(token)
+            response = await self._send(client, method, url, retries, content=content, params=params, headers=headers)
 
         return self._handle_response(response)
 
+    async def _send(
+        self, client: httpx.AsyncClient, method: str, url: str, retries: int, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying up to `retries` times on 502/503/504 with exponential backoff.
+
+        A concurrency slot is held per attempt only, so requests waiting out a
+        backoff do not block other calls.
+        """
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            async with self._semaphore:
+                response = await client.request(method, url, **kwargs)
+            if response.status_code not in _RETRY_STATUSES:
+                break
+        return response
+
+    async def _iter_list(self, url: str, params: dict | None = None) -> AsyncIterator[dict]:
+        """GET a JSON array endpoint and yield its items as they are parsed.
+
+        With ijson installed the body is parsed incrementally, so only one item
+        is held in memory at a time; otherwise the response is parsed in full.
+        Errors, token refresh and gateway error retries are handled as in _request().
+        """
+        if ijson is None:
+            for item in await self._request("GET", url, params=params) or ():
+                yield item
+            return
+
+        client = self._get_client()
+        for attempt in range(2):
+            token = self._access_token
+            async with self._semaphore, client.stream("GET", url, params=params) as response:
+                if response.status_code == 401 and attempt == 0:
+                    await self._refresh_access_token(token)
+                    continue
+
+                if response.status_code in _RETRY_STATUSES:
+                    break
+
+                content_type = response.headers.get("content-type", "")
+                if response.status_code != 200 or "application/json" not in content_type:
+                    # Not a plain JSON 200: let _handle_response raise or parse it in full
+                    await response.aread()
+                    for item in self._handle_response(response) or ():
+                        yield item
+                    return
+
+                reader = _AsyncByteReader(response.aiter_bytes())
+                try:
+                    async for item in ijson.items(reader, "item", use_float=True):
+                        yield item
+                except ijson.JSONError as e:
+                    raise GimsApiError(
+                        response.status_code,
+                        "Failed to parse JSON response",
+                        f"Content-Type was '{content_type}' but body is not valid JSON: {e}",
+                    ) from e
+                return
+
+        # Transient gateway error: fall back to _request(), which retries with backoff
+        await asyncio.sleep(RETRY_BACKOFF)
+        for item in await self._request("GET", url, params=params) or ():
+            yield item
+
+    async def _get_reference(self, url: str, ttl: float = REFERENCE_CACHE_TTL) -> Any:
+        """GET a reference data endpoint, caching the result for ttl seconds."""
+        now = time.monotonic()
+        cached = self._reference_cache.get(url)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        result = await self._request("GET", url)
+        self._reference_cache[url] = (now + ttl, result)
+        return result
+
+    async def _modify(self, list_url: str, method: str, url: str, json: Any = None) -> Any:
+        """Send a modifying request, then drop the cached list at list_url (even on failure)."""
+        try:
+            return await self._request(method, url, json=json)
+        finally:
+            self._reference_cache.pop(list_url, None)
+
+    def invalidate_reference_cache(self) -> None:
+        """Drop cached reference data so the next lookups hit the API."""
+        self._reference_cache.clear()
+
+    # ==================== Folders (shared by scripts, datasource and activator types) ====================
+
+    async def _create_folder(self, url: str, name: str, parent_folder_id: int | None) -> dict:
+        data = _drop_none(name=name, parent_folder_id=parent_folder_id)
+        return await self._modify(url, "POST", url, json=data)
+
+    async def _update_folder(self, url: str, folder_id: int, name: str | None, parent_folder_id: int | None) -> dict:
+        data = _drop_none(name=name, parent_folder_id=parent_folder_id)
+        return await self._modify(url, "PATCH", f"{url}{folder_id}/", json=data)
+
+    async def _delete_folder(self, url: str, folder_id: int) -> None:
+        return await self._modify(url, "DELETE", f"{url}{folder_id}/")
+
     # ==================== Scripts ====================
 
     async def list_script_folders(self) -> list[dict]:
@@ -238,30 +501,31 @@ class GimsClient:
 
     async def create_script_folder(self, name: str, parent_folder_id: int | None = None) -> dict:
         """Create a script folder."""
-        data = {"name": name}
-        if parent_folder_id is not None:
-            data["parent_folder_id"] = parent_folder_id
-        return await self._request("POST", "/scripts/folder/", json=data)
+        return await self._create_folder("/scripts/folder/", name, parent_folder_id)
 
     async def update_script_folder(self, folder_id: int, name: str | None = None, parent_folder_id: int | None = None) -> dict:
         """Update a script folder."""
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if parent_folder_id is not None:
-            data["parent_folder_id"] = parent_folder_id
-        return await self._request("PATCH", f"/scripts/folder/{folder_id}/", json=data)
+        return await self._update_folder("/scripts/folder/", folder_id, name, parent_folder_id)
 
     async def delete_script_folder(self, folder_id: int) -> None:
         """Delete a script folder."""
-        return await self._request("DELETE", f"/scripts/folder/{folder_id}/")
+        return await self._delete_folder("/scripts/folder/", folder_id)
+
+    async def iter_scripts(self, folder_id: int | None = None) -> AsyncIterator[dict]:
+        """Yield scripts as they are parsed, optionally filtered by folder.
+
+        Only one script (with its code) is held in memory at a time when ijson is
+        installed. The folder filter is sent to the server to reduce the payload
+        and is re-applied locally, so the result is correct even if it is ignored.
+        """
+        params = {"folder_id": folder_id} if folder_id is not None else None
+        async for script in self._iter_list("/scripts/script/", params=params):
+            if folder_id is None or script.get("folder_id") == folder_id:
+                yield script
 
     async def list_scripts(self, folder_id: int | None = None) -> list[dict]:
-        """Get all scripts, optionally filtered by folder."""
-        scripts = await self._request("GET", "/scripts/script/")
-        if folder_id is not None:
-            scripts = [s for s in scripts if s.get("folder_id") == folder_id]
-        return scripts
+        """Get all scripts, optionally filtered by folder (see iter_scripts)."""
+        return [s async for s in self.iter_scripts(folder_id)]
 
     async def get_script(self, script_id: int) -> dict:
         """Get a script by ID."""
@@ -269,22 +533,14 @@ class GimsClient:
 
     async def create_script(self, name: str, code: str = "", folder_id: int | None = None) -> dict:
         """Create a script."""
-        data = {"name": name, "code": code}
-        if folder_id is not None:
-            data["folder_id"] = folder_id
+        data = _drop_none(name=name, code=code, folder_id=folder_id)
         return await self._request("POST", "/scripts/script/", json=data)
 
     async def update_script(
         self, script_id: int, name: str | None = None, code: str | None = None, folder_id: int | None = None
     ) -> dict:
         """Update a script."""
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if code is not None:
-            data["code"] = code
-        if folder_id is not None:
-            data["folder_id"] = folder_id
+        data = _drop_none(name=name, code=code, folder_id=folder_id)
         return await self._request("PATCH", f"/scripts/script/{script_id}/", json=data)
 
     async def delete_script(self, script_id: int) -> None:
@@ -295,42 +551,34 @@ class GimsClient:
         """Search scripts by code."""
         params = {
             "search_code": search_code,
-            "case_sensitive": "true" if case_sensitive else "false",
-            "exact_match": "true" if exact_match else "false",
+            "case_sensitive": _BOOL_STR[bool(case_sensitive)],
+            "exact_match": _BOOL_STR[bool(exact_match)],
         }
         return await self._request("GET", "/scripts/search_code/", params=params)
 
     # ==================== DataSource Type Folders ====================
 
     async def list_datasource_type_folders(self) -> list[dict]:
-        """Get all datasource type folders."""
-        return await self._request("GET", "/datasource_types/folder/")
+        """Get all datasource type folders (cached, see LIST_CACHE_TTL)."""
+        return await self._get_reference("/datasource_types/folder/", LIST_CACHE_TTL)
 
     async def create_datasource_type_folder(self, name: str, parent_folder_id: int | None = None) -> dict:
         """Create a datasource type folder."""
-        data = {"name": name}
-        if parent_folder_id is not None:
-            data["parent_folder_id"] = parent_folder_id
-        return await self._request("POST", "/datasource_types/folder/", json=data)
+        return await self._create_folder("/datasource_types/folder/", name, parent_folder_id)
 
     async def update_datasource_type_folder(self, folder_id: int, name: str | None = None, parent_folder_id: int | None = None) -> dict:
         """Update a datasource type folder."""
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if parent_folder_id is not None:
-            data["parent_folder_id"] = parent_folder_id
-        return await self._request("PATCH", f"/datasource_types/folder/{folder_id}/", json=data)
+        return await self._update_folder("/datasource_types/folder/", folder_id, name, parent_folder_id)
 
     async def delete_datasource_type_folder(self, folder_id: int) -> None:
         """Delete a datasource type folder."""
-        return await self._request("DELETE", f"/datasource_types/folder/{folder_id}/")
+        return await self._delete_folder("/datasource_types/folder/", folder_id)
 
     # ==================== DataSource Types ====================
 
     async def list_datasource_types(self) -> list[dict]:
-        """Get all datasource types."""
-        return await self._request("GET", "/datasource_types/ds_type/")
+        """Get all datasource types (cached, see LIST_CACHE_TTL)."""
+        return await self._get_reference("/datasource_types/ds_type/", LIST_CACHE_TTL)
 
     async def get_datasource_type(self, type_id: int) -> dict:
         """Get a datasource type by ID."""
@@ -340,10 +588,8 @@ class GimsClient:
         self, name: str, description: str = "", version: str = "1.0", folder_id: int | None = None
     ) -> dict:
         """Create a datasource type."""
-        data = {"name": name, "description": description, "version": version}
-        if folder_id is not None:
-            data["folder"] = folder_id
-        return await self._request("POST", "/datasource_types/ds_type/", json=data)
+        data = _drop_none(name=name, description=description, version=version, folder=folder_id)
+        return await self._modify("/datasource_types/ds_type/", "POST", "/datasource_types/ds_type/", json=data)
 
     async def update_datasource_type(
         self,
@@ -354,20 +600,14 @@ class GimsClient:
         folder_id: int | None = None,
     ) -> dict:
         """Update a datasource type."""
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if description is not None:
-            data["description"] = description
-        if version is not None:
-            data["version"] = version
-        if folder_id is not None:
-            data["folder"] = folder_id
-        return await self._request("PATCH", f"/datasource_types/ds_type/{type_id}/", json=data)
+        data = _drop_none(name=name, description=description, version=version, folder=folder_id)
+        return await self._modify(
+            "/datasource_types/ds_type/", "PATCH", f"/datasource_types/ds_type/{type_id}/", json=data
+        )
 
     async def delete_datasource_type(self, type_id: int) -> None:
         """Delete a datasource type."""
-        return await self._request("DELETE", f"/datasource_types/ds_type/{type_id}/")
+        return await self._modify("/datasource_types/ds_type/", "DELETE", f"/datasource_types/ds_type/{type_id}/")
 
     # ==================== DataSource Type Properties ====================
 
@@ -405,7 +645,8 @@ class GimsClient:
 
     async def update_datasource_type_property(self, property_id: int, **kwargs) -> dict:
         """Update a datasource type property."""
-        return await self._request("PATCH", f"/datasource_types/properties/{property_id}/", json=kwargs)
+        data = _drop_none(**kwargs)
+        return await self._request("PATCH", f"/datasource_types/properties/{property_id}/", json=data)
 
     async def delete_datasource_type_property(self, property_id: int) -> None:
         """Delete a datasource type property."""
@@ -436,7 +677,8 @@ class GimsClient:
 
     async def update_datasource_type_method(self, method_id: int, **kwargs) -> dict:
         """Update a datasource type method."""
-        return await self._request("PATCH", f"/datasource_types/method/{method_id}/", json=kwargs)
+        data = _drop_none(**kwargs)
+        return await self._request("PATCH", f"/datasource_types/method/{method_id}/", json=data)
 
     async def delete_datasource_type_method(self, method_id: int) -> None:
         """Delete a datasource type method."""
@@ -474,7 +716,8 @@ class GimsClient:
 
     async def update_method_parameter(self, parameter_id: int, **kwargs) -> dict:
         """Update a method parameter."""
-        return await self._request("PATCH", f"/datasource_types/method_params/{parameter_id}/", json=kwargs)
+        data = _drop_none(**kwargs)
+        return await self._request("PATCH", f"/datasource_types/method_params/{parameter_id}/", json=data)
 
     async def delete_method_parameter(self, parameter_id: int) -> None:
         """Delete a method parameter."""
@@ -483,28 +726,20 @@ class GimsClient:
     # ==================== Activator Type Folders ====================
 
     async def list_activator_type_folders(self) -> list[dict]:
-        """Get all activator type folders."""
-        return await self._request("GET", "/activator_type/folder/")
+        """Get all activator type folders (cached, see LIST_CACHE_TTL)."""
+        return await self._get_reference("/activator_type/folder/", LIST_CACHE_TTL)
 
     async def create_activator_type_folder(self, name: str, parent_folder_id: int | None = None) -> dict:
         """Create an activator type folder."""
-        data = {"name": name}
-        if parent_folder_id is not None:
-            data["parent_folder_id"] = parent_folder_id
-        return await self._request("POST", "/activator_type/folder/", json=data)
+        return await self._create_folder("/activator_type/folder/", name, parent_folder_id)
 
     async def update_activator_type_folder(self, folder_id: int, name: str | None = None, parent_folder_id: int | None = None) -> dict:
         """Update an activator type folder."""
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if parent_folder_id is not None:
-            data["parent_folder_id"] = parent_folder_id
-        return await self._request("PATCH", f"/activator_type/folder/{folder_id}/", json=data)
+        return await self._update_folder("/activator_type/folder/", folder_id, name, parent_folder_id)
 
     async def delete_activator_type_folder(self, folder_id: int) -> None:
         """Delete an activator type folder."""
-        return await self._request("DELETE", f"/activator_type/folder/{folder_id}/")
+        return await self._delete_folder("/activator_type/folder/", folder_id)
 
     # ==================== Activator Types ====================
 
@@ -519,20 +754,19 @@ class GimsClient:
     async def create_activator_type(
         self,
         name: str,
-        code: str = "# Print all built-in variables and functions for help\nprint_help()",
+        code: str = DEFAULT_ACTIVATOR_CODE,
         description: str = "",
         version: str = "1.0",
         folder_id: int | None = None,
     ) -> dict:
         """Create an activator type."""
-        data = {"name": name, "code": code, "description": description, "version": version}
-        if folder_id is not None:
-            data["folder"] = folder_id
+        data = _drop_none(name=name, code=code, description=description, version=version, folder=folder_id)
         return await self._request("POST", "/activator_types/activator_type/", json=data)
 
     async def update_activator_type(self, type_id: int, **kwargs) -> dict:
         """Update an activator type."""
-        return await self._request("PATCH", f"/activator_types/activator_type/{type_id}/", json=kwargs)
+        data = _drop_none(**kwargs)
+        return await self._request("PATCH", f"/activator_types/activator_type/{type_id}/", json=data)
 
     async def delete_activator_type(self, type_id: int) -> None:
         """Delete an activator type."""
@@ -541,11 +775,15 @@ class GimsClient:
     # ==================== Activator Type Properties ====================
 
     async def list_activator_type_properties(self, activator_type_id: int | None = None) -> list[dict]:
-        """Get all activator type properties."""
-        properties = await self._request("GET", "/activator_types/properties/")
-        if activator_type_id is not None:
-            properties = [p for p in properties if p.get("activator_type_id") == activator_type_id]
-        return properties
+        """Get all activator type properties, optionally filtered by activator type.
+
+        The type filter is sent to the server and re-applied locally (see iter_scripts).
+        """
+        params = {"activator_type_id": activator_type_id} if activator_type_id is not None else None
+        return [
+            p async for p in self._iter_list("/activator_types/properties/", params=params)
+            if activator_type_id is None or p.get("activator_type_id") == activator_type_id
+        ]
 
     async def create_activator_type_property(
         self,
@@ -577,7 +815,8 @@ class GimsClient:
 
     async def update_activator_type_property(self, property_id: int, **kwargs) -> dict:
         """Update an activator type property."""
-        return await self._request("PATCH", f"/activator_types/properties/{property_id}/", json=kwargs)
+        data = _drop_none(**kwargs)
+        return await self._request("PATCH", f"/activator_types/properties/{property_id}/", json=data)
 
     async def delete_activator_type_property(self, property_id: int) -> None:
         """Delete an activator type property."""
@@ -586,12 +825,21 @@ class GimsClient:
     # ==================== References ====================
 
     async def list_value_types(self) -> list[dict]:
-        """Get all value types."""
-        return await self._request("GET", "/rest/value_types/")
+        """Get all value types (cached, see REFERENCE_CACHE_TTL)."""
+        return await self._get_reference("/rest/value_types/")
 
     async def list_property_sections(self) -> list[dict]:
-        """Get all property sections."""
-        return await self._request("GET", "/rest/property_sections/")
+        """Get all property sections (cached, see REFERENCE_CACHE_TTL)."""
+        return await self._get_reference("/rest/property_sections/")
+
+    async def prefetch_refs(self) -> tuple[list[dict], list[dict]]:
+        """Fetch value types and property sections concurrently (both are cached afterwards).
+
+        Returns:
+            Tuple of (value types, property sections).
+        """
+        value_types, sections = await asyncio.gather(self.list_value_types(), self.list_property_sections())
+        return value_types, sections
 
     # ==================== Script Logs ====================
 
@@ -631,27 +879,15 @@ class GimsClient:
         Raises:
             GimsApiError: On connection or streaming errors.
         """
-        # If URL is relative (starts with /), prepend GIMS base URL
-        if url.startswith("/"):
-            url = f"{self.config.url}{url}"
-
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Accept": "text/event-stream",
-        }
-
-        start_time = time.monotonic()
-        # Use small read timeout to ensure periodic timeout checks
-        # (logviewer sends keepalive every 10s, so 5s ensures we check twice per keepalive interval)
-        read_timeout = 5.0
+        deadline = time.monotonic() + timeout
 
         async def _stream_with_client(client: httpx.AsyncClient) -> AsyncIterator[str]:
             """Inner generator that streams from given client."""
-            async with client.stream("GET", url, headers=headers) as response:
+            token = self._access_token
+            async with client.stream("GET", url) as response:
                 if response.status_code == 401:
-                    # Try to refresh token
-                    await self._refresh_access_token()
-                    headers["Authorization"] = f"Bearer {self._access_token}"
+                    # Try to refresh token (updates the stream client's headers)
+                    await self._refresh_access_token(token)
                     raise httpx.RequestError("Token refreshed, need reconnect")
 
                 if response.status_code != 200:
@@ -661,30 +897,34 @@ class GimsClient:
                         f"HTTP {response.status_code}",
                     )
 
-                async for line in response.aiter_lines():
-                    # Check timeout on every line (including keepalives)
-                    if time.monotonic() - start_time >= timeout:
+                # Split lines on bytes and decode only data lines; keepalives are dropped undecoded
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    # Check timeout on every chunk (including keepalives)
+                    if time.monotonic() >= deadline:
                         return  # Timeout reached
-                    if line.startswith("data:"):
-                        yield line[5:]  # Remove "data:" prefix
+                    buffer += chunk
+                    while (end := buffer.find(b"\n")) != -1:
+                        line = bytes(buffer[:end]).rstrip(b"\r")
+                        del buffer[: end + 1]
+                        if line.startswith(b"data:"):
+                            yield line[5:].decode("utf-8", "replace")  # Remove "data:" prefix
+                if buffer.startswith(b"data:"):
+                    yield bytes(buffer[5:]).rstrip(b"\r").decode("utf-8", "replace")
 
         while True:
             # Check overall timeout before each connection attempt
-            if time.monotonic() - start_time >= timeout:
+            if time.monotonic() >= deadline:
                 return
 
             try:
-                async with httpx.AsyncClient(
-                    timeout=httpx.Timeout(read_timeout, connect=10.0),
-                    verify=self.config.verify_ssl,
-                ) as client:
-                    async for data in _stream_with_client(client):
-                        yield data
-                    # Stream ended normally (e.g., server closed connection)
-                    return
+                async for data in _stream_with_client(self._get_sse_client()):
+                    yield data
+                # Stream ended normally (e.g., server closed connection)
+                return
             except httpx.ReadTimeout:
                 # Read timeout - check if overall timeout reached, if not continue
-                if time.monotonic() - start_time >= timeout:
+                if time.monotonic() >= deadline:
                     return
                 # Otherwise, reconnect and continue streaming
                 continue
@@ -692,6 +932,31 @@ class GimsClient:
                 # Token refresh or other error - retry if we have time
                 if "Token refreshed" in str(e):
                     continue
-                if time.monotonic() - start_time >= timeout:
+                if time.monotonic() >= deadline:
                     return
                 raise GimsApiError(0, "SSE connection error", str(e)) from e
+
+
+# Clients shared across the process, keyed by the whole Config: clients whose
+# timeouts, limits or credentials differ must not share a connection pool
+_shared_clients: dict[Config, GimsClient] = {}
+
+
+def get_shared_client(config: Config) -> GimsClient:
+    """Return the process-wide client for this configuration, creating it on first use.
+
+    Reusing one client keeps its connection pool (and TLS sessions) warm across callers.
+    Close all shared clients with close_shared_clients() on shutdown.
+    """
+    client = _shared_clients.get(config)
+    if client is None:
+        client = _shared_clients[config] = GimsClient(config)
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close and forget all clients created by get_shared_client()."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.close()
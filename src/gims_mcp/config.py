@@ -1,18 +1,58 @@
 """Configuration management for GIMS MCP Server."""
 
+import functools
 import os
 from dataclasses import dataclass
 
+# Environment variable values (lowercase) read as False
+_FALSE_ENV_VALUES = frozenset({"false", "0", "no", "off"})
 
+
+@functools.lru_cache(maxsize=16)
 def _parse_bool_env(value: str | None, default: bool = True) -> bool:
     """Parse boolean from environment variable.
 
     Accepts: 'false', '0', 'no', 'off' as False (case-insensitive).
-    Everything else (including empty/None) returns default.
+    None returns default; everything else returns True.
     """
     if value is None:
         return default
-    return value.lower() not in ("false", "0", "no", "off")
+    return value.lower() not in _FALSE_ENV_VALUES
+
+
+# Accepted boolean CLI values (lowercase) -> parsed boolean
+_BOOL_ARG_VALUES = {
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _normalize_bool_arg(value: str) -> bool | None:
+    """Map a boolean CLI value to a boolean, or None if it is not recognized."""
+    return _BOOL_ARG_VALUES.get(value.lower())
+
+
+def _parse_bool_arg(value: str, name: str) -> bool:
+    """Parse a boolean CLI argument strictly.
+
+    Unlike environment variables, unknown values are rejected.
+
+    Raises:
+        ValueError: If the value is not a recognized boolean string.
+    """
+    result = _normalize_bool_arg(value)
+    if result is None:
+        raise ValueError(
+            f"Invalid {name} value '{value}'. Use 'true', 'false', '1', '0', 'yes', 'no', 'on', or 'off'."
+        )
+    return result
 
 
 # Default response size limit in KB
@@ -21,8 +61,15 @@ DEFAULT_MAX_RESPONSE_SIZE_KB = 10
 # Default log stream timeout in seconds
 DEFAULT_LOG_STREAM_TIMEOUT = 60
 
+# Default HTTP connection pool limits
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
 
-@dataclass
+# Default time in seconds an idle pooled connection is kept open
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Server configuration."""
 
@@ -33,6 +80,11 @@ class Config:
     verify_ssl: bool = True
     max_response_size_kb: int = DEFAULT_MAX_RESPONSE_SIZE_KB
     log_stream_timeout: int = DEFAULT_LOG_STREAM_TIMEOUT
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    # Concurrent API requests; matches max_connections so requests wait here rather than in the pool
+    max_concurrency: int = DEFAULT_MAX_CONNECTIONS
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -66,17 +118,22 @@ class Config:
         url: str | None = None,
         access_token: str | None = None,
         refresh_token: str | None = None,
-        verify_ssl: bool | None = None,
+        verify_ssl: bool | str | None = None,
         max_response_size_kb: int | None = None,
         log_stream_timeout: int | None = None,
     ) -> "Config":
-        """Create config from CLI arguments, falling back to environment variables."""
+        """Create config from CLI arguments, falling back to environment variables.
+
+        verify_ssl may be passed as the raw --verify-ssl string; it is parsed here.
+        """
         final_url = url or os.environ.get("GIMS_URL", "")
         final_access_token = access_token or os.environ.get("GIMS_ACCESS_TOKEN", "")
         final_refresh_token = refresh_token or os.environ.get("GIMS_REFRESH_TOKEN", "")
 
         # verify_ssl: CLI argument takes precedence, then env var, then default True
-        if verify_ssl is not None:
+        if isinstance(verify_ssl, str):
+            final_verify_ssl = _parse_bool_arg(verify_ssl, "--verify-ssl")
+        elif verify_ssl is not None:
             final_verify_ssl = verify_ssl
         else:
             final_verify_ssl = _parse_bool_env(os.environ.get("GIMS_VERIFY_SSL"), default=True)
@@ -1,17 +1,71 @@
 """Serialization of GIMS components to YAML format for Git storage."""
 
+import re
 from datetime import datetime, timezone
 
 import yaml
 
+# Use the libyaml C emitter/parser when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
 
-def serialize_script(script_data: dict, gims_url: str) -> tuple[str, str]:
+# Method label from a file path inside a method folder: methods/<label>/...
+_METHOD_PATH_RE = re.compile(r"methods/([^/]*)/")
+
+# _dump_yaml() output for empty sections; the files are still written so a
+# re-export replaces any stale list left in the repository
+_EMPTY_PROPERTIES_YAML = "properties: []\n"
+_EMPTY_PARAMETERS_YAML = "parameters: []\n"
+
+
+def _dump_yaml(data: dict) -> str:
+    """Dump data to YAML in the export format."""
+    return yaml.dump(data, Dumper=_Dumper, allow_unicode=True, default_flow_style=False)
+
+
+def _dump_properties(properties: list | None) -> str:
+    """Dump a properties.yaml file, skipping the emitter when there are none."""
+    if not properties:
+        return _EMPTY_PROPERTIES_YAML
+    return _dump_yaml({"properties": [serialize_property(p) for p in properties]})
+
+
+def _dump_parameters(parameters: list | None) -> str:
+    """Dump a method params.yaml file, skipping the emitter when there are none."""
+    if not parameters:
+        return _EMPTY_PARAMETERS_YAML
+    return _dump_yaml({"parameters": [serialize_parameter(p) for p in parameters]})
+
+
+def load_yaml(content: str):
+    """Parse YAML content safely (like yaml.safe_load)."""
+    return yaml.load(content, Loader=_Loader)
+
+
+def _load_file(files: dict[str, str], path: str) -> dict:
+    """Parse a YAML file from an exported component; a missing or empty file is {}."""
+    content = files.get(path)
+    return load_yaml(content) if content else {}
+
+
+def export_timestamp() -> str:
+    """Return the current UTC time in ISO format, as stored in exported_at."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def serialize_script(script_data: dict, gims_url: str, exported_at: str | None = None) -> tuple[str, str]:
     """
     Serialize a script to meta.yaml and code.py format.
 
     Args:
         script_data: Script data from GIMS API.
         gims_url: GIMS instance URL for tracking export source.
+        exported_at: Export timestamp; pass one export_timestamp() value to share it
+            across a batch of components (default: now).
 
     Returns:
         Tuple of (meta_yaml_content, code_content).
@@ -22,24 +76,26 @@ def serialize_script(script_data: dict, gims_url: str) -> tuple[str, str]:
         "version": "1.0",
         "gims_folder": script_data.get("folder_path", "/"),
         "code_file": "code.py",
-        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "exported_at": exported_at or export_timestamp(),
         "exported_from": gims_url,
     }
 
     # Include updated_at if available for comparison
-    if script_data.get("updated_at"):
-        meta["gims_updated_at"] = script_data["updated_at"]
+    if updated_at := script_data.get("updated_at"):
+        meta["gims_updated_at"] = updated_at
 
-    return yaml.dump(meta, allow_unicode=True, default_flow_style=False), script_data.get("code", "")
+    return _dump_yaml(meta), script_data.get("code", "")
 
 
-def serialize_datasource_type(type_data: dict, gims_url: str) -> dict[str, str]:
+def serialize_datasource_type(type_data: dict, gims_url: str, exported_at: str | None = None) -> dict[str, str]:
     """
     Serialize a datasource type with all properties and methods.
 
     Args:
         type_data: Datasource type data from GIMS API (with properties and methods).
         gims_url: GIMS instance URL for tracking export source.
+        exported_at: Export timestamp; pass one export_timestamp() value to share it
+            across a batch of components (default: now).
 
     Returns:
         Dictionary mapping file paths to their content:
@@ -59,45 +115,46 @@ def serialize_datasource_type(type_data: dict, gims_url: str) -> dict[str, str]:
         "description": type_data.get("description", ""),
         "version": type_data.get("version", "1.0"),
         "gims_folder": type_data.get("folder_path", "/"),
-        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "exported_at": exported_at or export_timestamp(),
         "exported_from": gims_url,
     }
-    if type_data.get("updated_at"):
-        meta["gims_updated_at"] = type_data["updated_at"]
-    files["meta.yaml"] = yaml.dump(meta, allow_unicode=True, default_flow_style=False)
+    if updated_at := type_data.get("updated_at"):
+        meta["gims_updated_at"] = updated_at
+    files["meta.yaml"] = _dump_yaml(meta)
 
     # properties.yaml
-    props = {"properties": [serialize_property(p) for p in type_data.get("properties", [])]}
-    files["properties.yaml"] = yaml.dump(props, allow_unicode=True, default_flow_style=False)
+    files["properties.yaml"] = _dump_properties(type_data.get("properties"))
 
     # methods/
     for method in type_data.get("methods", []):
-        method_folder = f"methods/{method['label']}"
+        label = method["label"]
+        method_folder = f"methods/{label}"
         method_meta = {
             "name": method["name"],
-            "label": method["label"],
+            "label": label,
             "description": method.get("description", ""),
             "code_file": "code.py",
             "params_file": "params.yaml",
         }
-        if method.get("updated_at"):
-            method_meta["gims_updated_at"] = method["updated_at"]
-        files[f"{method_folder}/meta.yaml"] = yaml.dump(method_meta, allow_unicode=True, default_flow_style=False)
+        if updated_at := method.get("updated_at"):
+            method_meta["gims_updated_at"] = updated_at
+        files[f"{method_folder}/meta.yaml"] = _dump_yaml(method_meta)
         files[f"{method_folder}/code.py"] = method.get("code", "# No code")
 
-        params = {"parameters": [serialize_parameter(p) for p in method.get("parameters", [])]}
-        files[f"{method_folder}/params.yaml"] = yaml.dump(params, allow_unicode=True, default_flow_style=False)
+        files[f"{method_folder}/params.yaml"] = _dump_parameters(method.get("parameters"))
 
     return files
 
 
-def serialize_activator_type(type_data: dict, gims_url: str) -> dict[str, str]:
+def serialize_activator_type(type_data: dict, gims_url: str, exported_at: str | None = None) -> dict[str, str]:
     """
     Serialize an activator type with all properties and code.
 
     Args:
         type_data: Activator type data from GIMS API (with properties).
         gims_url: GIMS instance URL for tracking export source.
+        exported_at: Export timestamp; pass one export_timestamp() value to share it
+            across a batch of components (default: now).
 
     Returns:
         Dictionary mapping file paths to their content:
@@ -116,19 +173,18 @@ def serialize_activator_type(type_data: dict, gims_url: str) -> dict[str, str]:
         "version": type_data.get("version", "1.0"),
         "gims_folder": type_data.get("folder_path", "/"),
         "code_file": "code.py",
-        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "exported_at": exported_at or export_timestamp(),
         "exported_from": gims_url,
     }
-    if type_data.get("updated_at"):
-        meta["gims_updated_at"] = type_data["updated_at"]
-    files["meta.yaml"] = yaml.dump(meta, allow_unicode=True, default_flow_style=False)
+    if updated_at := type_data.get("updated_at"):
+        meta["gims_updated_at"] = updated_at
+    files["meta.yaml"] = _dump_yaml(meta)
 
     # code.py
     files["code.py"] = type_data.get("code", "# No code")
 
     # properties.yaml
-    props = {"properties": [serialize_property(p) for p in type_data.get("properties", [])]}
-    files["properties.yaml"] = yaml.dump(props, allow_unicode=True, default_flow_style=False)
+    files["properties.yaml"] = _dump_properties(type_data.get("properties"))
 
     return files
 
@@ -154,8 +210,8 @@ def serialize_property(prop: dict) -> dict:
         "is_inner": prop.get("is_inner", False),
         "description": prop.get("description", ""),
     }
-    if prop.get("updated_at"):
-        result["gims_updated_at"] = prop["updated_at"]
+    if updated_at := prop.get("updated_at"):
+        result["gims_updated_at"] = updated_at
     return result
 
 
@@ -177,8 +233,8 @@ def serialize_parameter(param: dict) -> dict:
         "description": param.get("description", ""),
         "is_hidden": param.get("is_hidden", False),
     }
-    if param.get("updated_at"):
-        result["gims_updated_at"] = param["updated_at"]
+    if updated_at := param.get("updated_at"):
+        result["gims_updated_at"] = updated_at
     return result
 
 
@@ -210,8 +266,8 @@ def deserialize_datasource_type(files: dict[str, str]) -> dict:
     Returns:
         Dictionary suitable for GIMS API create/update.
     """
-    meta = yaml.safe_load(files.get("meta.yaml", "{}"))
-    props_data = yaml.safe_load(files.get("properties.yaml", "properties: []"))
+    meta = _load_file(files, "meta.yaml")
+    props_data = _load_file(files, "properties.yaml")
 
     result = {
         "name": meta.get("name", ""),
@@ -222,11 +278,7 @@ def deserialize_datasource_type(files: dict[str, str]) -> dict:
     }
 
     # Parse methods from methods/<label>/ folders
-    method_folders = set()
-    for path in files.keys():
-        if path.startswith("methods/") and "/" in path[8:]:
-            label = path.split("/")[1]
-            method_folders.add(label)
+    method_folders = {m.group(1) for path in files if (m := _METHOD_PATH_RE.match(path))}
 
     for label in method_folders:
         method_meta_path = f"methods/{label}/meta.yaml"
@@ -234,7 +286,7 @@ def deserialize_datasource_type(files: dict[str, str]) -> dict:
         method_params_path = f"methods/{label}/params.yaml"
 
         if method_meta_path in files:
-            method_meta = yaml.safe_load(files[method_meta_path])
+            method_meta = load_yaml(files[method_meta_path])
             method = {
                 "name": method_meta.get("name", label),
                 "label": method_meta.get("label", label),
@@ -244,7 +296,7 @@ def deserialize_datasource_type(files: dict[str, str]) -> dict:
             }
 
             if method_params_path in files:
-                params_data = yaml.safe_load(files[method_params_path])
+                params_data = load_yaml(files[method_params_path])
                 method["parameters"] = params_data.get("parameters", [])
 
             result["methods"].append(method)
@@ -262,8 +314,8 @@ def deserialize_activator_type(files: dict[str, str]) -> dict:
     Returns:
         Dictionary suitable for GIMS API create/update.
     """
-    meta = yaml.safe_load(files.get("meta.yaml", "{}"))
-    props_data = yaml.safe_load(files.get("properties.yaml", "properties: []"))
+    meta = _load_file(files, "meta.yaml")
+    props_data = _load_file(files, "properties.yaml")
 
     return {
         "name": meta.get("name", ""),
@@ -1,88 +1,104 @@
 """MCP Server for GIMS Automation."""
 
+import functools
+import importlib
 import logging
+from collections.abc import Awaitable, Callable
+from types import ModuleType
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import TextContent
+from mcp.types import TextContent, Tool
 
-from .client import GimsClient, GimsApiError
+from .client import GimsApiError, GimsClient, close_shared_clients, get_shared_client
 from .config import Config
-from .tools.scripts import get_script_tools, handle_script_tool
-from .tools.datasource_types import get_datasource_type_tools, handle_datasource_type_tool
-from .tools.activator_types import get_activator_type_tools, handle_activator_type_tool
-from .tools.references import get_reference_tools, handle_reference_tool
-from .tools.logs import get_log_tools, handle_log_tool
-from .tools.sync import get_sync_tools, handle_sync_tool
 from .utils import format_error, set_max_response_size
 
 logger = logging.getLogger(__name__)
 
+# Tool families: (module in .tools, function listing its tools, function handling its calls).
+# Modules are imported on first use so server startup does not load them (sync pulls in PyYAML).
+_TOOL_MODULES = (
+    ("scripts", "get_script_tools", "handle_script_tool"),
+    ("datasource_types", "get_datasource_type_tools", "handle_datasource_type_tool"),
+    ("activator_types", "get_activator_type_tools", "handle_activator_type_tool"),
+    ("references", "get_reference_tools", "handle_reference_tool"),
+    ("logs", "get_log_tools", "handle_log_tool"),
+    ("sync", "get_sync_tools", "handle_sync_tool"),
+)
+
+
+@functools.cache
+def _load_tool_module(name: str) -> ModuleType:
+    """Import a tool module from .tools on first use."""
+    return importlib.import_module(f".tools.{name}", __package__)
+
+
+@functools.cache
+def _tool_list() -> tuple[Tool, ...]:
+    """All tool definitions; they are static, so they are built once."""
+    tools: list[Tool] = []
+    for module, get_tools, _ in _TOOL_MODULES:
+        tools.extend(getattr(_load_tool_module(module), get_tools)())
+    return tuple(tools)
+
+
+ToolHandler = Callable[[str, dict, GimsClient], Awaitable[list[TextContent] | None]]
+
+
+@functools.cache
+def _tool_handlers() -> dict[str, ToolHandler]:
+    """Map each tool name to its family's handler (built on first use)."""
+    handlers: dict[str, ToolHandler] = {}
+    for module, get_tools, handle_tool in _TOOL_MODULES:
+        loaded = _load_tool_module(module)
+        handler = getattr(loaded, handle_tool)
+        for tool in getattr(loaded, get_tools)():
+            # First family wins, as with the previous handler chain
+            handlers.setdefault(tool.name, handler)
+    return handlers
+
 
 class GimsMcpServer:
     """MCP Server for GIMS Automation."""
 
     def __init__(self, config: Config):
         self.config = config
-        self.client = GimsClient(config)
+        self._client: GimsClient | None = None
         self.server = Server("gims-automation")
         self._setup_handlers()
 
+    @property
+    def client(self) -> GimsClient:
+        """API client, created on first tool call (listing tools does not need it)."""
+        if self._client is None:
+            self._client = get_shared_client(self.config)
+        return self._client
+
     def _setup_handlers(self):
         """Set up MCP server handlers."""
 
         @self.server.list_tools()
         async def list_tools():
             """Return list of available tools."""
-            tools = []
-            tools.extend(get_script_tools())
-            tools.extend(get_datasource_type_tools())
-            tools.extend(get_activator_type_tools())
-            tools.extend(get_reference_tools())
-            tools.extend(get_log_tools())
-            tools.extend(get_sync_tools())
-            return tools
+            return list(_tool_list())
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             """Handle tool calls."""
             try:
-                # Try script tools
-                result = await handle_script_tool(name, arguments, self.client)
-                if result is not None:
-                    return result
-
-                # Try datasource type tools
-                result = await handle_datasource_type_tool(name, arguments, self.client)
-                if result is not None:
-                    return result
-
-                # Try activator type tools
-                result = await handle_activator_type_tool(name, arguments, self.client)
-                if result is not None:
-                    return result
-
-                # Try reference tools
-                result = await handle_reference_tool(name, arguments, self.client)
-                if result is not None:
-                    return result
-
-                # Try log tools
-                result = await handle_log_tool(name, arguments, self.client)
-                if result is not None:
-                    return result
-
-                # Try sync tools
-                result = await handle_sync_tool(name, arguments, self.client)
-                if result is not None:
-                    return result
+                handler = _tool_handlers().get(name)
+                if handler is not None:
+                    result = await handler(name, arguments, self.client)
+                    if result is not None:
+                        return result
 
                 return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
             except GimsApiError as e:
                 return [TextContent(type="text", text=f"GIMS API Error ({e.status_code}): {e.message}\nDetail: {e.detail}")]
             except Exception as e:
-                logger.exception(f"Error calling tool {name}")
+                logger.exception("Error calling tool %s", name)
                 return [TextContent(type="text", text=f"Error: {format_error(e)}")]
 
     async def run(self):
@@ -92,7 +108,8 @@ class GimsMcpServer:
 
     async def close(self):
         """Close server resources."""
-        await self.client.close()
+        if self._client is not None:
+            await self._client.close()
 
 
 async def run_server(config: Config):
@@ -104,4 +121,4 @@ async def run_server(config: Config):
     try:
         await server.run()
     finally:
-        await server.close()
+        await close_shared_clients()
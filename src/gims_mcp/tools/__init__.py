@@ -1,20 +1,26 @@
 """MCP Tools for GIMS Automation."""
 
-from .scripts import get_script_tools, handle_script_tool
-from .datasource_types import get_datasource_type_tools, handle_datasource_type_tool
-from .activator_types import get_activator_type_tools, handle_activator_type_tool
-from .references import get_reference_tools, handle_reference_tool
-from .logs import get_log_tools, handle_log_tool
+import importlib
 
-__all__ = [
-    "get_script_tools",
-    "handle_script_tool",
-    "get_datasource_type_tools",
-    "handle_datasource_type_tool",
-    "get_activator_type_tools",
-    "handle_activator_type_tool",
-    "get_reference_tools",
-    "handle_reference_tool",
-    "get_log_tools",
-    "handle_log_tool",
-]
+# Exported name -> submodule defining it; submodules are imported on first attribute access
+_EXPORTS = {
+    "get_script_tools": "scripts",
+    "handle_script_tool": "scripts",
+    "get_datasource_type_tools": "datasource_types",
+    "handle_datasource_type_tool": "datasource_types",
+    "get_activator_type_tools": "activator_types",
+    "handle_activator_type_tool": "activator_types",
+    "get_reference_tools": "references",
+    "handle_reference_tool": "references",
+    "get_log_tools": "logs",
+    "handle_log_tool": "logs",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
@@ -1,40 +1,36 @@
 """MCP Tools for Activator Types."""
 
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+
 from mcp.types import Tool, TextContent
 
-from ..client import GimsClient, GimsApiError
+from ..client import DEFAULT_ACTIVATOR_CODE, GimsClient, GimsApiError
 from ..utils import (
     build_folder_paths,
     build_item_paths,
     search_in_code,
+    compile_search_pattern,
     format_error,
     check_response_size,
     ResponseTooLargeError,
 )
 
+ActivatorTypeHandler = Callable[[GimsClient, dict], Awaitable[list[TextContent]]]
+
+# Default number of batch_execute_activator_type operations run at once
+DEFAULT_BATCH_CONCURRENCY = 8
+
 
 async def handle_activator_type_tool(name: str, arguments: dict, client: GimsClient) -> list[TextContent] | None:
     """Handle activator type tool calls. Returns None if tool not handled."""
     try:
-        handlers = {
-            "list_activator_type_folders": _list_activator_type_folders,
-            "create_activator_type_folder": _create_activator_type_folder,
-            "update_activator_type_folder": _update_activator_type_folder,
-            "delete_activator_type_folder": _delete_activator_type_folder,
-            "list_activator_types": _list_activator_types,
-            "get_activator_type": _get_activator_type,
-            "get_activator_type_code": _get_activator_type_code,
-            "create_activator_type": _create_activator_type,
-            "update_activator_type": _update_activator_type,
-            "delete_activator_type": _delete_activator_type,
-            "list_activator_type_properties": _list_activator_type_properties,
-            "create_activator_type_property": _create_activator_type_property,
-            "update_activator_type_property": _update_activator_type_property,
-            "delete_activator_type_property": _delete_activator_type_property,
-            "search_activator_types": _search_activator_types,
-        }
-        if name in handlers:
-            return await handlers[name](client, arguments)
+        if name == "batch_execute_activator_type":
+            return await _batch_execute_activator_type(client, arguments)
+        handler = _HANDLERS.get(name)
+        if handler is not None:
+            return await handler(client, arguments)
     except ResponseTooLargeError as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
     except GimsApiError as e:
@@ -44,193 +40,229 @@ async def handle_activator_type_tool(name: str, arguments: dict, client: GimsCli
     return None
 
 
-def get_activator_type_tools() -> list[Tool]:
-    """Get the list of activator type tools."""
-    return [
-        # Folders
-        Tool(
-            name="list_activator_type_folders",
-            description="List all activator type folders with their hierarchy paths",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="create_activator_type_folder",
-            description="Create a new activator type folder",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Folder name"},
-                    "parent_folder_id": {"type": "integer", "description": "Parent folder ID (optional)"},
-                },
-                "required": ["name"],
-            },
-        ),
-        Tool(
-            name="update_activator_type_folder",
-            description="Update an activator type folder",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "folder_id": {"type": "integer", "description": "Folder ID"},
-                    "name": {"type": "string", "description": "New name"},
-                    "parent_folder_id": {"type": "integer", "description": "New parent folder ID"},
-                },
-                "required": ["folder_id"],
+# Built once: the tool definitions never change at runtime
+_ACTIVATOR_TYPE_TOOLS: tuple[Tool, ...] = (
+    # Folders
+    Tool(
+        name="list_activator_type_folders",
+        description="List all activator type folders with their hierarchy paths",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="create_activator_type_folder",
+        description="Create a new activator type folder",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "parent_folder_id": {"type": "integer", "description": "Parent folder ID (optional)"},
             },
-        ),
-        Tool(
-            name="delete_activator_type_folder",
-            description="Delete an activator type folder",
-            inputSchema={
-                "type": "object",
-                "properties": {"folder_id": {"type": "integer", "description": "Folder ID"}},
-                "required": ["folder_id"],
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="update_activator_type_folder",
+        description="Update an activator type folder",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "folder_id": {"type": "integer"},
+                "name": {"type": "string"},
+                "parent_folder_id": {"type": "integer"},
             },
-        ),
-        # Types
-        Tool(
-            name="list_activator_types",
-            description="List all activator types",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="get_activator_type",
-            description="Get activator type metadata. Code is filtered by default - use get_activator_type_code to retrieve code.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type_id": {"type": "integer", "description": "Type ID"},
-                    "include_properties": {"type": "boolean", "description": "Include properties (default: true)"},
-                },
-                "required": ["type_id"],
-            },
-        ),
-        Tool(
-            name="get_activator_type_code",
-            description="Get the full code of an activator type. Use this when you need to read or analyze the activator code.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type_id": {"type": "integer", "description": "Type ID"},
-                },
-                "required": ["type_id"],
+            "required": ["folder_id"],
+        },
+    ),
+    Tool(
+        name="delete_activator_type_folder",
+        description="Delete an activator type folder",
+        inputSchema={
+            "type": "object",
+            "properties": {"folder_id": {"type": "integer"}},
+            "required": ["folder_id"],
+        },
+    ),
+    # Types
+    Tool(
+        name="list_activator_types",
+        description="List all activator types",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="get_activator_type",
+        description="Get activator type metadata. Code is filtered by default - use get_activator_type_code to retrieve code.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type_id": {"type": "integer"},
+                "include_properties": {"type": "boolean", "description": "Include properties (default: true)"},
             },
-        ),
-        Tool(
-            name="create_activator_type",
-            description="Create a new activator type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Type name"},
-                    "code": {"type": "string", "description": "Python code for the activator"},
-                    "description": {"type": "string", "description": "Description"},
-                    "version": {"type": "string", "description": "Version (default: 1.0)"},
-                    "folder_id": {"type": "integer", "description": "Folder ID (optional)"},
-                },
-                "required": ["name"],
+            "required": ["type_id"],
+        },
+    ),
+    Tool(
+        name="get_activator_type_code",
+        description="Get the full code of an activator type. Use this when you need to read or analyze the activator code.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type_id": {"type": "integer"},
             },
-        ),
-        Tool(
-            name="update_activator_type",
-            description="Update an activator type (including its code)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type_id": {"type": "integer", "description": "Type ID"},
-                    "name": {"type": "string", "description": "New name"},
-                    "code": {"type": "string", "description": "New Python code"},
-                    "description": {"type": "string", "description": "New description"},
-                    "version": {"type": "string", "description": "New version"},
-                    "folder_id": {"type": "integer", "description": "New folder ID"},
-                },
-                "required": ["type_id"],
+            "required": ["type_id"],
+        },
+    ),
+    Tool(
+        name="create_activator_type",
+        description="Create a new activator type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "code": {"type": "string", "description": "Python code for the activator"},
+                "description": {"type": "string"},
+                "version": {"type": "string", "description": "Version (default: 1.0)"},
+                "folder_id": {"type": "integer", "description": "Folder ID (optional)"},
             },
-        ),
-        Tool(
-            name="delete_activator_type",
-            description="Delete an activator type",
-            inputSchema={
-                "type": "object",
-                "properties": {"type_id": {"type": "integer", "description": "Type ID"}},
-                "required": ["type_id"],
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="update_activator_type",
+        description="Update an activator type (including its code)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type_id": {"type": "integer"},
+                "name": {"type": "string"},
+                "code": {"type": "string"},
+                "description": {"type": "string"},
+                "version": {"type": "string"},
+                "folder_id": {"type": "integer"},
             },
-        ),
-        # Properties
-        Tool(
-            name="list_activator_type_properties",
-            description="List all properties of an activator type",
-            inputSchema={
-                "type": "object",
-                "properties": {"activator_type_id": {"type": "integer", "description": "Activator type ID"}},
-                "required": ["activator_type_id"],
+            "required": ["type_id"],
+        },
+    ),
+    Tool(
+        name="delete_activator_type",
+        description="Delete an activator type",
+        inputSchema={
+            "type": "object",
+            "properties": {"type_id": {"type": "integer"}},
+            "required": ["type_id"],
+        },
+    ),
+    # Properties
+    Tool(
+        name="list_activator_type_properties",
+        description="List all properties of an activator type",
+        inputSchema={
+            "type": "object",
+            "properties": {"activator_type_id": {"type": "integer"}},
+            "required": ["activator_type_id"],
+        },
+    ),
+    Tool(
+        name="create_activator_type_property",
+        description="Create a new property for an activator type. Property is accessed in activator code directly by label name (NOT through self).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "activator_type_id": {"type": "integer"},
+                "name": {"type": "string", "description": "Property display name"},
+                "label": {"type": "string", "description": "Property label - variable name in code (snake_case, English)"},
+                "value_type_id": {"type": "integer", "description": "Value type ID (use list_value_types). IMPORTANT: Do NOT use 'Список' or 'Справочник' types - use 'Объект' instead"},
+                "section_name_id": {"type": "integer", "description": "Section ID (use list_property_sections)"},
+                "description": {"type": "string"},
+                "default_value": {"type": "string"},
+                "is_required": {"type": "boolean", "description": "Is required (default: false)"},
+                "is_hidden": {"type": "boolean", "description": "Is hidden (default: false)"},
+                "default_dict_value_id": {"type": ["integer", "null"], "description": "Default dictionary value ID (for dictionary properties)"},
             },
-        ),
-        Tool(
-            name="create_activator_type_property",
-            description="Create a new property for an activator type. Property is accessed in activator code directly by label name (NOT through self).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "activator_type_id": {"type": "integer", "description": "Activator type ID"},
-                    "name": {"type": "string", "description": "Property display name"},
-                    "label": {"type": "string", "description": "Property label - variable name in code (snake_case, English)"},
-                    "value_type_id": {"type": "integer", "description": "Value type ID (use list_value_types). IMPORTANT: Do NOT use 'Список' or 'Справочник' types - use 'Объект' instead"},
-                    "section_name_id": {"type": "integer", "description": "Section ID (use list_property_sections)"},
-                    "description": {"type": "string", "description": "Description"},
-                    "default_value": {"type": "string", "description": "Default value"},
-                    "is_required": {"type": "boolean", "description": "Is required (default: false)"},
-                    "is_hidden": {"type": "boolean", "description": "Is hidden (default: false)"},
-                    "default_dict_value_id": {"type": ["integer", "null"], "description": "Default dictionary value ID (for dictionary properties)"},
-                },
-                "required": ["activator_type_id", "name", "label", "value_type_id", "section_name_id"],
+            "required": ["activator_type_id", "name", "label", "value_type_id", "section_name_id"],
+        },
+    ),
+    Tool(
+        name="update_activator_type_property",
+        description="Update an activator type property",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "property_id": {"type": "integer"},
+                "name": {"type": "string"},
+                "label": {"type": "string"},
+                "description": {"type": "string"},
+                "default_value": {"type": "string"},
+                "is_required": {"type": "boolean"},
+                "is_hidden": {"type": "boolean"},
             },
-        ),
-        Tool(
-            name="update_activator_type_property",
-            description="Update an activator type property",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "property_id": {"type": "integer", "description": "Property ID"},
-                    "name": {"type": "string", "description": "New name"},
-                    "label": {"type": "string", "description": "New label"},
-                    "description": {"type": "string", "description": "New description"},
-                    "default_value": {"type": "string", "description": "New default value"},
-                    "is_required": {"type": "boolean", "description": "Is required"},
-                    "is_hidden": {"type": "boolean", "description": "Is hidden"},
+            "required": ["property_id"],
+        },
+    ),
+    Tool(
+        name="delete_activator_type_property",
+        description="Delete an activator type property",
+        inputSchema={
+            "type": "object",
+            "properties": {"property_id": {"type": "integer"}},
+            "required": ["property_id"],
+        },
+    ),
+    # Search
+    Tool(
+        name="search_activator_types",
+        description="Search activator types by name and/or code. Default searches by name only.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query (substring or regex)"},
+                "search_in": {
+                    "type": "string",
+                    "description": "Where to search: 'name' (default), 'code', or 'both'",
+                    "enum": ["name", "code", "both"],
                 },
-                "required": ["property_id"],
+                "case_sensitive": {"type": "boolean", "description": "Case-sensitive search (default: false)"},
             },
-        ),
-        Tool(
-            name="delete_activator_type_property",
-            description="Delete an activator type property",
-            inputSchema={
-                "type": "object",
-                "properties": {"property_id": {"type": "integer", "description": "Property ID"}},
-                "required": ["property_id"],
-            },
-        ),
-        # Search
-        Tool(
-            name="search_activator_types",
-            description="Search activator types by name and/or code. Default searches by name only.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query (substring or regex)"},
-                    "search_in": {
-                        "type": "string",
-                        "description": "Where to search: 'name' (default), 'code', or 'both'",
-                        "enum": ["name", "code", "both"],
+            "required": ["query"],
+        },
+    ),
+    # Batch
+    Tool(
+        name="batch_execute_activator_type",
+        description="Run several independent activator type tool calls concurrently in one request. "
+        "Operations must not depend on each other's results.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {"type": "string", "description": "Activator type tool name"},
+                            "arguments": {"type": "object", "description": "Tool arguments"},
+                        },
+                        "required": ["tool"],
                     },
-                    "case_sensitive": {"type": "boolean", "description": "Case-sensitive search (default: false)"},
                 },
-                "required": ["query"],
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Skip operations not yet started after the first error (default: false)",
+                },
+                "max_concurrent": {
+                    "type": "integer",
+                    "description": f"Operations run at once (default: {DEFAULT_BATCH_CONCURRENCY})",
+                },
             },
-        ),
-    ]
+            "required": ["operations"],
+        },
+    ),
+)
+
+
+def get_activator_type_tools() -> list[Tool]:
+    """Get the list of activator type tools."""
+    return list(_ACTIVATOR_TYPE_TOOLS)
 
 
 # Handler implementations
@@ -270,9 +302,11 @@ async def _list_activator_types(client: GimsClient, arguments: dict) -> list[Tex
     folders = await client.list_activator_type_folders()
     folders_with_paths = build_folder_paths(folders)
     types = await client.list_activator_types()
-    # Remove code from list to reduce size
-    types_no_code = [{k: v for k, v in t.items() if k != "code"} for t in types]
-    types_with_paths = build_item_paths(types_no_code, folders_with_paths, folder_id_field="folder")
+    # Remove code from list to reduce size; the freshly fetched list is ours to modify
+    # and build_item_paths copies each item anyway
+    for t in types:
+        t.pop("code", None)
+    types_with_paths = build_item_paths(types, folders_with_paths, folder_id_field="folder")
     response = check_response_size({"types": types_with_paths})
     return [TextContent(type="text", text=response)]
 
@@ -312,7 +346,7 @@ async def _get_activator_type_code(client: GimsClient, arguments: dict) -> list[
 async def _create_activator_type(client: GimsClient, arguments: dict) -> list[TextContent]:
     result = await client.create_activator_type(
         name=arguments["name"],
-        code=arguments.get("code", "# Print all built-in variables and functions for help\nprint_help()"),
+        code=arguments.get("code", DEFAULT_ACTIVATOR_CODE),
         description=arguments.get("description", ""),
         version=arguments.get("version", "1.0"),
         folder_id=arguments.get("folder_id"),
@@ -365,44 +399,102 @@ async def _search_activator_types(client: GimsClient, arguments: dict) -> list[T
 
     results = []
     found_ids = set()
+    # Both branches search the same catalog with the same pattern
+    types = await client.list_activator_types()
+    pattern = compile_search_pattern(query, case_sensitive)
 
     # Search by name (default)
     if search_in in ("name", "both"):
-        types = await client.list_activator_types()
         name_results = search_in_code(
             types,
             query,
             code_field="name",
             case_sensitive=case_sensitive,
+            pattern=pattern,
         )
-        for r in name_results:
-            if r.get("id") not in found_ids:
-                # Remove code from results
-                r_no_code = {k: v for k, v in r.items() if k != "code"}
-                results.append(r_no_code)
-                found_ids.add(r.get("id"))
+        # search_in_code already leaves out the code and tags matched_in
+        results.extend(name_results)
+        found_ids = {r.get("id") for r in name_results}
 
     # Search by code
     if search_in in ("code", "both"):
-        types = await client.list_activator_types()
-        # Need to get full types with code
-        for t in types:
-            if t["id"] in found_ids:
-                continue
-            full_type = await client.get_activator_type(t["id"])
-            code_results = search_in_code(
-                [full_type],
-                query,
-                code_field="code",
-                case_sensitive=case_sensitive,
-            )
-            if code_results:
-                r = code_results[0]
-                # Remove code from results
-                r_no_code = {k: v for k, v in r.items() if k != "code"}
-                r_no_code["matched_in"] = "code"
-                results.append(r_no_code)
-                found_ids.add(t["id"])
+        # Need to get full types with code; fetch them concurrently (the client caps parallel requests)
+        pending = [t for t in types if t["id"] not in found_ids]
+        full_types = await asyncio.gather(*(client.get_activator_type(t["id"]) for t in pending))
+        code_results = search_in_code(
+            full_types,
+            query,
+            code_field="code",
+            case_sensitive=case_sensitive,
+            pattern=pattern,
+        )
+        results.extend(code_results)
+
+    response = check_response_size({"results": results, "count": len(results)})
+    return [TextContent(type="text", text=response)]
+
 
+async def _batch_execute_activator_type(client: GimsClient, arguments: dict) -> list[TextContent]:
+    """Run independent activator type tool calls concurrently.
+
+    Each operation gets an entry with status 'ok', 'error' or 'skipped' (after an
+    error when stop_on_error is set), in the order the operations were given.
+    """
+    operations = arguments["operations"]
+    stop_on_error = arguments.get("stop_on_error", False)
+    semaphore = asyncio.Semaphore(max(1, int(arguments.get("max_concurrent") or DEFAULT_BATCH_CONCURRENCY)))
+    failed = False
+
+    async def run(index: int, operation: dict) -> dict:
+        nonlocal failed
+        tool = operation.get("tool")
+        entry = {"index": index, "tool": tool}
+        handler = _HANDLERS.get(tool)
+        if handler is None:
+            entry.update(status="error", error=f"Unknown activator type tool: {tool}")
+            failed = True
+            return entry
+        async with semaphore:
+            if failed and stop_on_error:
+                entry["status"] = "skipped"
+                return entry
+            try:
+                content = await handler(client, dict(operation.get("arguments") or {}))
+            except GimsApiError as e:
+                failed = True
+                entry.update(status="error", error=f"{e.message}\nDetail: {e.detail}")
+                return entry
+            except Exception as e:
+                failed = True
+                entry.update(status="error", error=format_error(e))
+                return entry
+        text = content[0].text
+        try:
+            entry.update(status="ok", result=json.loads(text))
+        except ValueError:
+            entry.update(status="ok", result=text)
+        return entry
+
+    results = await asyncio.gather(*(run(i, op) for i, op in enumerate(operations)))
     response = check_response_size({"results": results, "count": len(results)})
     return [TextContent(type="text", text=response)]
+
+
+# Tool name -> handler, built once at import
+_HANDLERS: dict[str, ActivatorTypeHandler] = {
+    "list_activator_type_folders": _list_activator_type_folders,
+    "create_activator_type_folder": _create_activator_type_folder,
+    "update_activator_type_folder": _update_activator_type_folder,
+    "delete_activator_type_folder": _delete_activator_type_folder,
+    "list_activator_types": _list_activator_types,
+    "get_activator_type": _get_activator_type,
+    "get_activator_type_code": _get_activator_type_code,
+    "create_activator_type": _create_activator_type,
+    "update_activator_type": _update_activator_type,
+    "delete_activator_type": _delete_activator_type,
+    "list_activator_type_properties": _list_activator_type_properties,
+    "create_activator_type_property": _create_activator_type_property,
+    "update_activator_type_property": _update_activator_type_property,
+    "delete_activator_type_property": _delete_activator_type_property,
+    "search_activator_types": _search_activator_types,
+}
@@ -1,5 +1,8 @@
 """MCP Tools for DataSource Types."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
+
 from mcp.types import Tool, TextContent
 
 from ..client import GimsClient, GimsApiError
@@ -7,43 +10,21 @@ from ..utils import (
     build_folder_paths,
     build_item_paths,
     search_in_code,
+    compile_search_pattern,
     format_error,
     check_response_size,
     ResponseTooLargeError,
 )
 
+DatasourceTypeHandler = Callable[[GimsClient, dict], Awaitable[list[TextContent]]]
+
 
 async def handle_datasource_type_tool(name: str, arguments: dict, client: GimsClient) -> list[TextContent] | None:
     """Handle datasource type tool calls. Returns None if tool not handled."""
     try:
-        handlers = {
-            "list_datasource_type_folders": _list_datasource_type_folders,
-            "create_datasource_type_folder": _create_datasource_type_folder,
-            "update_datasource_type_folder": _update_datasource_type_folder,
-            "delete_datasource_type_folder": _delete_datasource_type_folder,
-            "list_datasource_types": _list_datasource_types,
-            "get_datasource_type": _get_datasource_type,
-            "create_datasource_type": _create_datasource_type,
-            "update_datasource_type": _update_datasource_type,
-            "delete_datasource_type": _delete_datasource_type,
-            "list_datasource_type_properties": _list_datasource_type_properties,
-            "create_datasource_type_property": _create_datasource_type_property,
-            "update_datasource_type_property": _update_datasource_type_property,
-            "delete_datasource_type_property": _delete_datasource_type_property,
-            "list_datasource_type_methods": _list_datasource_type_methods,
-            "get_datasource_type_method": _get_datasource_type_method,
-            "get_datasource_type_method_code": _get_datasource_type_method_code,
-            "create_datasource_type_method": _create_datasource_type_method,
-            "update_datasource_type_method": _update_datasource_type_method,
-            "delete_datasource_type_method": _delete_datasource_type_method,
-            "list_method_parameters": _list_method_parameters,
-            "create_method_parameter": _create_method_parameter,
-            "update_method_parameter": _update_method_parameter,
-            "delete_method_parameter": _delete_method_parameter,
-            "search_datasource_types": _search_datasource_types,
-        }
-        if name in handlers:
-            return await handlers[name](client, arguments)
+        handler = _HANDLERS.get(name)
+        if handler is not None:
+            return await handler(client, arguments)
     except ResponseTooLargeError as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
     except GimsApiError as e:
@@ -53,304 +34,313 @@ async def handle_datasource_type_tool(name: str, arguments: dict, client: GimsCl
     return None
 
 
-def get_datasource_type_tools() -> list[Tool]:
-    """Get the list of datasource type tools."""
-    return [
-        # Folders
-        Tool(
-            name="list_datasource_type_folders",
-            description="List all datasource type folders with their hierarchy paths",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="create_datasource_type_folder",
-            description="Create a new datasource type folder",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Folder name"},
-                    "parent_folder_id": {"type": "integer", "description": "Parent folder ID (optional)"},
-                },
-                "required": ["name"],
+# Built once: the tool definitions never change at runtime
+_DATASOURCE_TYPE_TOOLS: tuple[Tool, ...] = (
+    # Folders
+    Tool(
+        name="list_datasource_type_folders",
+        description="List all datasource type folders with their hierarchy paths",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="create_datasource_type_folder",
+        description="Create a new datasource type folder",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Folder name"},
+                "parent_folder_id": {"type": "integer", "description": "Parent folder ID (optional)"},
             },
-        ),
-        Tool(
-            name="update_datasource_type_folder",
-            description="Update a datasource type folder",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "folder_id": {"type": "integer", "description": "Folder ID"},
-                    "name": {"type": "string", "description": "New name"},
-                    "parent_folder_id": {"type": "integer", "description": "New parent folder ID"},
-                },
-                "required": ["folder_id"],
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="update_datasource_type_folder",
+        description="Update a datasource type folder",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "folder_id": {"type": "integer", "description": "Folder ID"},
+                "name": {"type": "string", "description": "New name"},
+                "parent_folder_id": {"type": "integer", "description": "New parent folder ID"},
             },
-        ),
-        Tool(
-            name="delete_datasource_type_folder",
-            description="Delete a datasource type folder",
-            inputSchema={
-                "type": "object",
-                "properties": {"folder_id": {"type": "integer", "description": "Folder ID"}},
-                "required": ["folder_id"],
+            "required": ["folder_id"],
+        },
+    ),
+    Tool(
+        name="delete_datasource_type_folder",
+        description="Delete a datasource type folder",
+        inputSchema={
+            "type": "object",
+            "properties": {"folder_id": {"type": "integer", "description": "Folder ID"}},
+            "required": ["folder_id"],
+        },
+    ),
+    # Types
+    Tool(
+        name="list_datasource_types",
+        description="List all datasource types",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="get_datasource_type",
+        description="Get a datasource type. Use include_properties=false and include_methods=false to get only basic type info (useful when full response is too large)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type_id": {"type": "integer", "description": "Type ID"},
+                "include_properties": {"type": "boolean", "description": "Include properties (default: true)"},
+                "include_methods": {"type": "boolean", "description": "Include methods with code (default: true)"},
             },
-        ),
-        # Types
-        Tool(
-            name="list_datasource_types",
-            description="List all datasource types",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="get_datasource_type",
-            description="Get a datasource type. Use include_properties=false and include_methods=false to get only basic type info (useful when full response is too large)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type_id": {"type": "integer", "description": "Type ID"},
-                    "include_properties": {"type": "boolean", "description": "Include properties (default: true)"},
-                    "include_methods": {"type": "boolean", "description": "Include methods with code (default: true)"},
-                },
-                "required": ["type_id"],
+            "required": ["type_id"],
+        },
+    ),
+    Tool(
+        name="create_datasource_type",
+        description="Create a new datasource type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Type name"},
+                "description": {"type": "string", "description": "Description"},
+                "version": {"type": "string", "description": "Version (default: 1.0)"},
+                "folder_id": {"type": "integer", "description": "Folder ID (optional)"},
             },
-        ),
-        Tool(
-            name="create_datasource_type",
-            description="Create a new datasource type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Type name"},
-                    "description": {"type": "string", "description": "Description"},
-                    "version": {"type": "string", "description": "Version (default: 1.0)"},
-                    "folder_id": {"type": "integer", "description": "Folder ID (optional)"},
-                },
-                "required": ["name"],
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="update_datasource_type",
+        description="Update a datasource type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type_id": {"type": "integer", "description": "Type ID"},
+                "name": {"type": "string", "description": "New name"},
+                "description": {"type": "string", "description": "New description"},
+                "version": {"type": "string", "description": "New version"},
+                "folder_id": {"type": "integer", "description": "New folder ID"},
             },
-        ),
-        Tool(
-            name="update_datasource_type",
-            description="Update a datasource type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type_id": {"type": "integer", "description": "Type ID"},
-                    "name": {"type": "string", "description": "New name"},
-                    "description": {"type": "string", "description": "New description"},
-                    "version": {"type": "string", "description": "New version"},
-                    "folder_id": {"type": "integer", "description": "New folder ID"},
-                },
-                "required": ["type_id"],
+            "required": ["type_id"],
+        },
+    ),
+    Tool(
+        name="delete_datasource_type",
+        description="Delete a datasource type",
+        inputSchema={
+            "type": "object",
+            "properties": {"type_id": {"type": "integer", "description": "Type ID"}},
+            "required": ["type_id"],
+        },
+    ),
+    # Properties
+    Tool(
+        name="list_datasource_type_properties",
+        description="List all properties of a datasource type",
+        inputSchema={
+            "type": "object",
+            "properties": {"mds_type_id": {"type": "integer", "description": "Datasource type ID"}},
+            "required": ["mds_type_id"],
+        },
+    ),
+    Tool(
+        name="create_datasource_type_property",
+        description="Create a new property for a datasource type. Property is accessed in method code via self.property_label",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mds_type_id": {"type": "integer", "description": "Datasource type ID"},
+                "name": {"type": "string", "description": "Property display name"},
+                "label": {"type": "string", "description": "Property label - variable name in code (snake_case, English). Access via self.label"},
+                "value_type_id": {"type": "integer", "description": "Value type ID (use list_value_types). IMPORTANT: Do NOT use 'Список' or 'Справочник' types - use 'Объект' instead"},
+                "section_name_id": {"type": "integer", "description": "Section ID (use list_property_sections)"},
+                "description": {"type": "string", "description": "Description"},
+                "default_value": {"type": "string", "description": "Default value"},
+                "is_required": {"type": "boolean", "description": "Is required (default: false)"},
+                "is_hidden": {"type": "boolean", "description": "Is hidden (default: false)"},
+                "default_dict_value_id": {"type": ["integer", "null"], "description": "Default dictionary value ID (for dictionary properties)"},
             },
-        ),
-        Tool(
-            name="delete_datasource_type",
-            description="Delete a datasource type",
-            inputSchema={
-                "type": "object",
-                "properties": {"type_id": {"type": "integer", "description": "Type ID"}},
-                "required": ["type_id"],
+            "required": ["mds_type_id", "name", "label", "value_type_id", "section_name_id"],
+        },
+    ),
+    Tool(
+        name="update_datasource_type_property",
+        description="Update a datasource type property",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "property_id": {"type": "integer", "description": "Property ID"},
+                "name": {"type": "string", "description": "New name"},
+                "label": {"type": "string", "description": "New label"},
+                "description": {"type": "string", "description": "New description"},
+                "default_value": {"type": "string", "description": "New default value"},
+                "is_required": {"type": "boolean", "description": "Is required"},
+                "is_hidden": {"type": "boolean", "description": "Is hidden"},
             },
-        ),
-        # Properties
-        Tool(
-            name="list_datasource_type_properties",
-            description="List all properties of a datasource type",
-            inputSchema={
-                "type": "object",
-                "properties": {"mds_type_id": {"type": "integer", "description": "Datasource type ID"}},
-                "required": ["mds_type_id"],
+            "required": ["property_id"],
+        },
+    ),
+    Tool(
+        name="delete_datasource_type_property",
+        description="Delete a datasource type property",
+        inputSchema={
+            "type": "object",
+            "properties": {"property_id": {"type": "integer", "description": "Property ID"}},
+            "required": ["property_id"],
+        },
+    ),
+    # Methods
+    Tool(
+        name="list_datasource_type_methods",
+        description="List all methods of a datasource type (without code, use get_datasource_type_method for full code)",
+        inputSchema={
+            "type": "object",
+            "properties": {"mds_type_id": {"type": "integer", "description": "Datasource type ID"}},
+            "required": ["mds_type_id"],
+        },
+    ),
+    Tool(
+        name="get_datasource_type_method",
+        description="Get method metadata and parameters. Code is filtered - use get_datasource_type_method_code to retrieve code.",
+        inputSchema={
+            "type": "object",
+            "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
+            "required": ["method_id"],
+        },
+    ),
+    Tool(
+        name="get_datasource_type_method_code",
+        description="Get the full code of a datasource type method. Use this when you need to read or analyze the method code.",
+        inputSchema={
+            "type": "object",
+            "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
+            "required": ["method_id"],
+        },
+    ),
+    Tool(
+        name="create_datasource_type_method",
+        description="Create a new method for a datasource type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mds_type_id": {"type": "integer", "description": "Datasource type ID"},
+                "name": {"type": "string", "description": "Method name"},
+                "label": {"type": "string", "description": "Method label (code identifier, English only)"},
+                "code": {"type": "string", "description": "Python code for the method"},
+                "description": {"type": "string", "description": "Description"},
             },
-        ),
-        Tool(
-            name="create_datasource_type_property",
-            description="Create a new property for a datasource type. Property is accessed in method code via self.property_label",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "mds_type_id": {"type": "integer", "description": "Datasource type ID"},
-                    "name": {"type": "string", "description": "Property display name"},
-                    "label": {"type": "string", "description": "Property label - variable name in code (snake_case, English). Access via self.label"},
-                    "value_type_id": {"type": "integer", "description": "Value type ID (use list_value_types). IMPORTANT: Do NOT use 'Список' or 'Справочник' types - use 'Объект' instead"},
-                    "section_name_id": {"type": "integer", "description": "Section ID (use list_property_sections)"},
-                    "description": {"type": "string", "description": "Description"},
-                    "default_value": {"type": "string", "description": "Default value"},
-                    "is_required": {"type": "boolean", "description": "Is required (default: false)"},
-                    "is_hidden": {"type": "boolean", "description": "Is hidden (default: false)"},
-                    "default_dict_value_id": {"type": ["integer", "null"], "description": "Default dictionary value ID (for dictionary properties)"},
-                },
-                "required": ["mds_type_id", "name", "label", "value_type_id", "section_name_id"],
+            "required": ["mds_type_id", "name", "label"],
+        },
+    ),
+    Tool(
+        name="update_datasource_type_method",
+        description="Update a datasource type method (including its code)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "method_id": {"type": "integer", "description": "Method ID"},
+                "name": {"type": "string", "description": "New name"},
+                "label": {"type": "string", "description": "New label"},
+                "code": {"type": "string", "description": "New Python code"},
+                "description": {"type": "string", "description": "New description"},
             },
-        ),
-        Tool(
-            name="update_datasource_type_property",
-            description="Update a datasource type property",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "property_id": {"type": "integer", "description": "Property ID"},
-                    "name": {"type": "string", "description": "New name"},
-                    "label": {"type": "string", "description": "New label"},
-                    "description": {"type": "string", "description": "New description"},
-                    "default_value": {"type": "string", "description": "New default value"},
-                    "is_required": {"type": "boolean", "description": "Is required"},
-                    "is_hidden": {"type": "boolean", "description": "Is hidden"},
-                },
-                "required": ["property_id"],
-            },
-        ),
-        Tool(
-            name="delete_datasource_type_property",
-            description="Delete a datasource type property",
-            inputSchema={
-                "type": "object",
-                "properties": {"property_id": {"type": "integer", "description": "Property ID"}},
-                "required": ["property_id"],
-            },
-        ),
-        # Methods
-        Tool(
-            name="list_datasource_type_methods",
-            description="List all methods of a datasource type (without code, use get_datasource_type_method for full code)",
-            inputSchema={
-                "type": "object",
-                "properties": {"mds_type_id": {"type": "integer", "description": "Datasource type ID"}},
-                "required": ["mds_type_id"],
+            "required": ["method_id"],
+        },
+    ),
+    Tool(
+        name="delete_datasource_type_method",
+        description="Delete a datasource type method",
+        inputSchema={
+            "type": "object",
+            "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
+            "required": ["method_id"],
+        },
+    ),
+    # Method Parameters
+    Tool(
+        name="list_method_parameters",
+        description="List all parameters of a method",
+        inputSchema={
+            "type": "object",
+            "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
+            "required": ["method_id"],
+        },
+    ),
+    Tool(
+        name="create_method_parameter",
+        description="Create input or output parameter for a datasource type method. Input parameters (input_type=true) are passed when calling the method. Output parameters (input_type=false) are returned as dict from the method.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "method_id": {"type": "integer", "description": "Method ID"},
+                "label": {"type": "string", "description": "Parameter label - variable name in method code (snake_case, English)"},
+                "value_type_id": {"type": "integer", "description": "Value type ID (use list_value_types). IMPORTANT: Do NOT use 'Список' or 'Справочник' types - use 'Объект' instead"},
+                "input_type": {"type": "boolean", "description": "true = INPUT parameter (passed to method), false = OUTPUT parameter (returned from method as dict key)"},
+                "default_value": {"type": "string", "description": "Default value"},
+                "description": {"type": "string", "description": "Description"},
+                "is_hidden": {"type": "boolean", "description": "Is hidden"},
+                "default_dict_value_id": {"type": ["integer", "null"], "description": "Default dictionary value ID (for dictionary properties)"},
             },
-        ),
-        Tool(
-            name="get_datasource_type_method",
-            description="Get method metadata and parameters. Code is filtered - use get_datasource_type_method_code to retrieve code.",
-            inputSchema={
-                "type": "object",
-                "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
-                "required": ["method_id"],
+            "required": ["method_id", "label", "value_type_id"],
+        },
+    ),
+    Tool(
+        name="update_method_parameter",
+        description="Update a method parameter",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "parameter_id": {"type": "integer", "description": "Parameter ID"},
+                "label": {"type": "string", "description": "New label"},
+                "default_value": {"type": "string", "description": "New default value"},
+                "description": {"type": "string", "description": "New description"},
+                "is_hidden": {"type": "boolean", "description": "Is hidden"},
             },
-        ),
-        Tool(
-            name="get_datasource_type_method_code",
-            description="Get the full code of a datasource type method. Use this when you need to read or analyze the method code.",
-            inputSchema={
-                "type": "object",
-                "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
-                "required": ["method_id"],
-            },
-        ),
-        Tool(
-            name="create_datasource_type_method",
-            description="Create a new method for a datasource type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "mds_type_id": {"type": "integer", "description": "Datasource type ID"},
-                    "name": {"type": "string", "description": "Method name"},
-                    "label": {"type": "string", "description": "Method label (code identifier, English only)"},
-                    "code": {"type": "string", "description": "Python code for the method"},
-                    "description": {"type": "string", "description": "Description"},
+            "required": ["parameter_id"],
+        },
+    ),
+    Tool(
+        name="delete_method_parameter",
+        description="Delete a method parameter",
+        inputSchema={
+            "type": "object",
+            "properties": {"parameter_id": {"type": "integer", "description": "Parameter ID"}},
+            "required": ["parameter_id"],
+        },
+    ),
+    # Search
+    Tool(
+        name="search_datasource_types",
+        description="Search datasource types by name and/or method code. Default searches by name only.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query (substring or regex)"},
+                "search_in": {
+                    "type": "string",
+                    "description": "Where to search: 'name' (default), 'code' (method code), or 'both'",
+                    "enum": ["name", "code", "both"],
                 },
-                "required": ["mds_type_id", "name", "label"],
+                "case_sensitive": {"type": "boolean", "description": "Case-sensitive search (default: false)"},
             },
-        ),
-        Tool(
-            name="update_datasource_type_method",
-            description="Update a datasource type method (including its code)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "method_id": {"type": "integer", "description": "Method ID"},
-                    "name": {"type": "string", "description": "New name"},
-                    "label": {"type": "string", "description": "New label"},
-                    "code": {"type": "string", "description": "New Python code"},
-                    "description": {"type": "string", "description": "New description"},
-                },
-                "required": ["method_id"],
-            },
-        ),
-        Tool(
-            name="delete_datasource_type_method",
-            description="Delete a datasource type method",
-            inputSchema={
-                "type": "object",
-                "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
-                "required": ["method_id"],
-            },
-        ),
-        # Method Parameters
-        Tool(
-            name="list_method_parameters",
-            description="List all parameters of a method",
-            inputSchema={
-                "type": "object",
-                "properties": {"method_id": {"type": "integer", "description": "Method ID"}},
-                "required": ["method_id"],
-            },
-        ),
-        Tool(
-            name="create_method_parameter",
-            description="Create input or output parameter for a datasource type method. Input parameters (input_type=true) are passed when calling the method. Output parameters (input_type=false) are returned as dict from the method.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "method_id": {"type": "integer", "description": "Method ID"},
-                    "label": {"type": "string", "description": "Parameter label - variable name in method code (snake_case, English)"},
-                    "value_type_id": {"type": "integer", "description": "Value type ID (use list_value_types). IMPORTANT: Do NOT use 'Список' or 'Справочник' types - use 'Объект' instead"},
-                    "input_type": {"type": "boolean", "description": "true = INPUT parameter (passed to method), false = OUTPUT parameter (returned from method as dict key)"},
-                    "default_value": {"type": "string", "description": "Default value"},
-                    "description": {"type": "string", "description": "Description"},
-                    "is_hidden": {"type": "boolean", "description": "Is hidden"},
-                    "default_dict_value_id": {"type": ["integer", "null"], "description": "Default dictionary value ID (for dictionary properties)"},
-                },
-                "required": ["method_id", "label", "value_type_id"],
-            },
-        ),
-        Tool(
-            name="update_method_parameter",
-            description="Update a method parameter",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "parameter_id": {"type": "integer", "description": "Parameter ID"},
-                    "label": {"type": "string", "description": "New label"},
-                    "default_value": {"type": "string", "description": "New default value"},
-                    "description": {"type": "string", "description": "New description"},
-                    "is_hidden": {"type": "boolean", "description": "Is hidden"},
-                },
-                "required": ["parameter_id"],
-            },
-        ),
-        Tool(
-            name="delete_method_parameter",
-            description="Delete a method parameter",
-            inputSchema={
-                "type": "object",
-                "properties": {"parameter_id": {"type": "integer", "description": "Parameter ID"}},
-                "required": ["parameter_id"],
-            },
-        ),
-        # Search
-        Tool(
-            name="search_datasource_types",
-            description="Search datasource types by name and/or method code. Default searches by name only.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query (substring or regex)"},
-                    "search_in": {
-                        "type": "string",
-                        "description": "Where to search: 'name' (default), 'code' (method code), or 'both'",
-                        "enum": ["name", "code", "both"],
-                    },
-                    "case_sensitive": {"type": "boolean", "description": "Case-sensitive search (default: false)"},
-                },
-                "required": ["query"],
-            },
-        ),
-    ]
+            "required": ["query"],
+        },
+    ),
+)
+
+
+def get_datasource_type_tools() -> list[Tool]:
+    """Get the list of datasource type tools."""
+    return list(_DATASOURCE_TYPE_TOOLS)
 
 
 # Handler implementations
 
+async def _none() -> None:
+    """Placeholder for an optional request skipped in an asyncio.gather()."""
+    return None
+
+
 async def _list_datasource_type_folders(client: GimsClient, arguments: dict) -> list[TextContent]:
     folders = await client.list_datasource_type_folders()
     folders_with_paths = build_folder_paths(folders)
@@ -396,21 +386,25 @@ async def _get_datasource_type(client: GimsClient, arguments: dict) -> list[Text
     include_properties = arguments.get("include_properties", True)
     include_methods = arguments.get("include_methods", True)
 
-    ds_type = await client.get_datasource_type(type_id)
+    # The type, its properties and its methods are independent requests
+    ds_type, properties, methods = await asyncio.gather(
+        client.get_datasource_type(type_id),
+        client.list_datasource_type_properties(type_id) if include_properties else _none(),
+        client.list_datasource_type_methods(type_id) if include_methods else _none(),
+    )
     result = {"type": ds_type}
 
     if include_properties:
-        properties = await client.list_datasource_type_properties(type_id)
         result["properties"] = properties
 
     if include_methods:
-        methods = await client.list_datasource_type_methods(type_id)
+        param_lists = await asyncio.gather(*(client.list_method_parameters(m["id"]) for m in methods))
         # Filter code from methods to reduce response size
         # Use get_datasource_type_method_code to retrieve code
         methods_filtered = []
-        for method in methods:
+        for method, parameters in zip(methods, param_lists, strict=True):
             method_filtered = {k: ("[FILTERED]" if k == "code" else v) for k, v in method.items()}
-            method_filtered["parameters"] = await client.list_method_parameters(method["id"])
+            method_filtered["parameters"] = parameters
             methods_filtered.append(method_filtered)
         result["methods"] = methods_filtered
 
@@ -467,9 +461,10 @@ async def _delete_datasource_type_property(client: GimsClient, arguments: dict)
 
 async def _list_datasource_type_methods(client: GimsClient, arguments: dict) -> list[TextContent]:
     methods = await client.list_datasource_type_methods(mds_type_id=arguments["mds_type_id"])
-    # Remove code from list to reduce size
-    methods_no_code = [{k: v for k, v in m.items() if k != "code"} for m in methods]
-    response = check_response_size({"methods": methods_no_code})
+    # Remove code from list to reduce size; the freshly fetched list is ours to modify
+    for m in methods:
+        m.pop("code", None)
+    response = check_response_size({"methods": methods})
     return [TextContent(type="text", text=response)]
 
 
@@ -559,15 +554,18 @@ async def _search_datasource_types(client: GimsClient, arguments: dict) -> list[
 
     results = []
     found_ids = set()
+    # Both branches search the same catalog with the same pattern
+    types = await client.list_datasource_types()
+    pattern = compile_search_pattern(query, case_sensitive)
 
     # Search by name (default)
     if search_in in ("name", "both"):
-        types = await client.list_datasource_types()
         name_results = search_in_code(
             types,
             query,
             code_field="name",
             case_sensitive=case_sensitive,
+            pattern=pattern,
         )
         for r in name_results:
             if r.get("id") not in found_ids:
@@ -576,16 +574,16 @@ async def _search_datasource_types(client: GimsClient, arguments: dict) -> list[
 
     # Search by method code
     if search_in in ("code", "both"):
-        types = await client.list_datasource_types()
-        for ds_type in types:
-            if ds_type["id"] in found_ids:
-                continue
-            methods = await client.list_datasource_type_methods(ds_type["id"])
+        # Fetch the methods of every candidate concurrently (the client caps parallel requests)
+        candidates = [t for t in types if t["id"] not in found_ids]
+        method_lists = await asyncio.gather(*(client.list_datasource_type_methods(t["id"]) for t in candidates))
+        for ds_type, methods in zip(candidates, method_lists, strict=True):
             method_results = search_in_code(
                 methods,
                 query,
                 code_field="code",
                 case_sensitive=case_sensitive,
+                pattern=pattern,
             )
             if method_results:
                 # Return type info with matched methods (without full code)
@@ -604,3 +602,32 @@ async def _search_datasource_types(client: GimsClient, arguments: dict) -> list[
 
     response = check_response_size({"results": results, "count": len(results)})
     return [TextContent(type="text", text=response)]
+
+
+# Tool name -> handler, built once at import
+_HANDLERS: dict[str, DatasourceTypeHandler] = {
+    "list_datasource_type_folders": _list_datasource_type_folders,
+    "create_datasource_type_folder": _create_datasource_type_folder,
+    "update_datasource_type_folder": _update_datasource_type_folder,
+    "delete_datasource_type_folder": _delete_datasource_type_folder,
+    "list_datasource_types": _list_datasource_types,
+    "get_datasource_type": _get_datasource_type,
+    "create_datasource_type": _create_datasource_type,
+    "update_datasource_type": _update_datasource_type,
+    "delete_datasource_type": _delete_datasource_type,
+    "list_datasource_type_properties": _list_datasource_type_properties,
+    "create_datasource_type_property": _create_datasource_type_property,
+    "update_datasource_type_property": _update_datasource_type_property,
+    "delete_datasource_type_property": _delete_datasource_type_property,
+    "list_datasource_type_methods": _list_datasource_type_methods,
+    "get_datasource_type_method": _get_datasource_type_method,
+    "get_datasource_type_method_code": _get_datasource_type_method_code,
+    "create_datasource_type_method": _create_datasource_type_method,
+    "update_datasource_type_method": _update_datasource_type_method,
+    "delete_datasource_type_method": _delete_datasource_type_method,
+    "list_method_parameters": _list_method_parameters,
+    "create_method_parameter": _create_method_parameter,
+    "update_method_parameter": _update_method_parameter,
+    "delete_method_parameter": _delete_method_parameter,
+    "search_datasource_types": _search_datasource_types,
+}
@@ -2,7 +2,6 @@
 
 from datetime import datetime
 
-import yaml
 from mcp.types import Tool, TextContent
 
 from ..client import GimsClient, GimsApiError
@@ -12,6 +11,7 @@ from ..serializers import (
     serialize_activator_type,
     deserialize_datasource_type,
     deserialize_activator_type,
+    load_yaml,
 )
 from ..validators import validate_python_syntax
 from ..utils import check_response_size, format_error, ResponseTooLargeError
@@ -203,7 +203,7 @@ async def _import_script(client: GimsClient, arguments: dict) -> list[TextConten
         return [TextContent(type="text", text=f"Error: Ошибка синтаксиса Python: {error}")]
 
     # Parse metadata
-    meta = yaml.safe_load(meta_yaml)
+    meta = load_yaml(meta_yaml)
     name = target_name or meta.get("name", "Unnamed Script")
 
     # Check if exists
@@ -274,8 +274,7 @@ async def _export_datasource_type(client: GimsClient, arguments: dict) -> list[T
 
 async def _resolve_reference_ids(client: GimsClient) -> tuple[dict[str, int], dict[str, int]]:
     """Get name -> id mappings for value_types and sections."""
-    value_types = await client.list_value_types()
-    sections = await client.list_property_sections()
+    value_types, sections = await client.prefetch_refs()
 
     vt_map = {vt["name"]: vt["id"] for vt in value_types}
     sec_map = {s["name"]: s["id"] for s in sections}
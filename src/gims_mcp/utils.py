@@ -4,6 +4,11 @@ import json
 import re
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default maximum response size in bytes (10KB)
 DEFAULT_MAX_RESPONSE_SIZE = 10 * 1024
 
@@ -27,17 +32,26 @@ def get_max_response_size() -> int:
 
 
 class ResponseTooLargeError(Exception):
-    """Raised when response exceeds maximum allowed size."""
+    """Raised when response exceeds maximum allowed size.
+
+    partial is set when encoding stopped at the limit, so size is only a lower bound.
+    """
 
-    def __init__(self, size: int, limit: int | None = None):
+    def __init__(self, size: int, limit: int | None = None, partial: bool = False):
         self.size = size
         self.limit = limit if limit is not None else _max_response_size
+        self.partial = partial
+        size_text = f"over {size // 1024}KB" if partial else f"{size // 1024}KB"
         super().__init__(
-            f"Response too large ({size // 1024}KB, limit {self.limit // 1024}KB). "
+            f"Response too large ({size_text}, limit {self.limit // 1024}KB). "
             "Please refine your query to reduce results."
         )
 
 
+# Fallback encoder; with indent it runs in pure Python, chunk by chunk
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
 def check_response_size(data: Any, limit: int | None = None) -> str:
     """Check response size and return JSON string if within limit.
 
@@ -52,11 +66,27 @@ def check_response_size(data: Any, limit: int | None = None) -> str:
         ResponseTooLargeError: If response exceeds limit
     """
     effective_limit = limit if limit is not None else _max_response_size
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
-    size = len(json_str.encode("utf-8"))
-    if size > effective_limit:
-        raise ResponseTooLargeError(size, effective_limit)
-    return json_str
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # Non-string keys or integers beyond 64 bits; the stdlib encoder handles these
+            pass
+        else:
+            if len(encoded) > effective_limit:
+                raise ResponseTooLargeError(len(encoded), effective_limit)
+            return encoded.decode("utf-8")
+
+    # The stdlib encoder is slow enough that an oversized response is abandoned
+    # as soon as it crosses the limit instead of being encoded in full
+    chunks = []
+    size = 0
+    for chunk in _JSON_ENCODER.iterencode(data):
+        size += len(chunk) if chunk.isascii() else len(chunk.encode("utf-8"))
+        if size > effective_limit:
+            raise ResponseTooLargeError(size, effective_limit, partial=True)
+        chunks.append(chunk)
+    return "".join(chunks)
 
 
 def build_folder_paths(
@@ -143,12 +173,22 @@ def build_item_paths(
     return result
 
 
+def compile_search_pattern(query: str, case_sensitive: bool = False) -> re.Pattern:
+    """Compile a search query as a regex, or as a literal string if it is not a valid regex."""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    try:
+        return re.compile(query, flags)
+    except re.error:
+        return re.compile(re.escape(query), flags)
+
+
 def search_in_code(
     items: list[dict],
     query: str,
     code_field: str = "code",
     case_sensitive: bool = False,
     include_code: bool = False,
+    pattern: re.Pattern | None = None,
 ) -> list[dict]:
     """Search for a pattern in code fields.
 
@@ -158,18 +198,15 @@ def search_in_code(
         code_field: Name of the code field to search in
         case_sensitive: Whether search should be case-sensitive
         include_code: Whether to include full 'code' field in results (default: False)
+        pattern: Query already compiled with compile_search_pattern(), for callers
+            searching several fields with the same query
 
     Returns:
         List of matching items with match info (without 'code' field by default)
     """
     results = []
-    flags = 0 if case_sensitive else re.IGNORECASE
-
-    try:
-        pattern = re.compile(query, flags)
-    except re.error:
-        # If not a valid regex, escape and use as literal string
-        pattern = re.compile(re.escape(query), flags)
+    if pattern is None:
+        pattern = compile_search_pattern(query, case_sensitive)
 
     for item in items:
         code = item.get(code_field, "")
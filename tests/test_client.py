@@ -1,10 +1,25 @@
 """Tests for GIMS API client."""
 
+import asyncio
+import json
+import ssl
+import time
+from dataclasses import replace
+
 import pytest
 import respx
 from httpx import Response
 
-from gims_mcp.client import GimsClient, GimsApiError, GimsAuthError
+from gims_mcp.client import (
+    REFERENCE_CACHE_TTL,
+    TRANSIENT_RETRIES,
+    GimsApiError,
+    GimsAuthError,
+    GimsClient,
+    _environment_proxy,
+    close_shared_clients,
+    get_shared_client,
+)
 
 
 class TestGimsClientScripts:
@@ -52,6 +67,55 @@ class TestGimsClientScripts:
         assert result[0]["folder_id"] == 2
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_iter_scripts(self, client, mock_api, sample_scripts):
+        """Test iterating over scripts of a folder."""
+        mock_api.get("/scripts/script/").mock(return_value=Response(200, json=sample_scripts))
+
+        result = [s async for s in client.iter_scripts(folder_id=3)]
+
+        assert result == [sample_scripts[1]]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_scripts_filter_sent_to_server(self, client, mock_api, sample_scripts):
+        """Test that the folder filter is passed as a query parameter."""
+        route = mock_api.get("/scripts/script/", params={"folder_id": "3"}).mock(
+            return_value=Response(200, json=sample_scripts[1:])
+        )
+
+        result = await client.list_scripts(folder_id=3)
+
+        assert result == sample_scripts[1:]
+        assert route.called
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_scripts_token_refresh(self, client, mock_api, sample_scripts):
+        """Test that streamed list endpoints refresh the token on 401."""
+        mock_api.get("/scripts/script/").mock(
+            side_effect=[Response(401), Response(200, json=sample_scripts)]
+        )
+
+        with respx.mock(base_url="https://gims.test.local/security") as security_mock:
+            security_mock.post("/token/refresh/").mock(return_value=Response(200, json={"access": "new-token"}))
+            result = await client.list_scripts()
+
+        assert result == sample_scripts
+        assert client._access_token == "new-token"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_scripts_error(self, client, mock_api):
+        """Test that streamed list endpoints report API errors."""
+        mock_api.get("/scripts/script/").mock(return_value=Response(403, json={"detail": "Forbidden"}))
+
+        with pytest.raises(GimsApiError) as exc_info:
+            await client.list_scripts()
+
+        assert exc_info.value.status_code == 403
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_get_script(self, client, mock_api, sample_scripts):
         """Test getting a single script."""
@@ -137,6 +201,55 @@ class TestGimsClientTokenRefresh:
         assert client._refresh_token == "test-refresh-token"
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_token_refresh_keeps_http_client(self, client, mock_api, sample_folders):
+        """Test that refresh and retry go through the same pooled client."""
+        route = mock_api.get("/scripts/folder/").mock(
+            side_effect=[Response(401), Response(200, json=sample_folders)]
+        )
+        http_client = client._get_client()
+
+        with respx.mock(base_url="https://gims.test.local/security") as security_mock:
+            refresh_route = security_mock.post("/token/refresh/").mock(
+                return_value=Response(200, json={"access": "new-access-token"})
+            )
+            await client.list_script_folders()
+
+        assert client._client is http_client
+        assert "Authorization" not in refresh_route.calls.last.request.headers
+        assert route.calls.last.request.headers["Authorization"] == "Bearer new-access-token"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_401s_refresh_once(self, client, mock_api, sample_folders):
+        """Test that parallel requests hitting an expired token share a single refresh."""
+        mock_api.get("/scripts/folder/").mock(
+            side_effect=lambda request: (
+                Response(200, json=sample_folders)
+                if request.headers["Authorization"] == "Bearer new-access-token"
+                else Response(401)
+            )
+        )
+        used_refresh_tokens = []
+
+        async def rotate(request):
+            # Slow refresh with rotation: a second use of the same refresh token is rejected
+            await asyncio.sleep(0.05)
+            token = json.loads(request.content)["refresh"]
+            if token in used_refresh_tokens:
+                return Response(401, json={"detail": "Token is blacklisted"})
+            used_refresh_tokens.append(token)
+            return Response(200, json={"access": "new-access-token", "refresh": "new-refresh-token"})
+
+        with respx.mock(base_url="https://gims.test.local/security") as security_mock:
+            refresh_route = security_mock.post("/token/refresh/").mock(side_effect=rotate)
+            results = await asyncio.gather(*(client.list_script_folders() for _ in range(4)))
+
+        assert results == [sample_folders] * 4
+        assert refresh_route.call_count == 1
+        assert client._refresh_token == "new-refresh-token"
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_token_refresh_with_rotation(self, client, mock_api, sample_folders):
         """Test token refresh when ROTATE_REFRESH_TOKENS is enabled."""
@@ -234,6 +347,18 @@ class TestGimsClientErrors:
         assert exc_info.value.status_code == 400
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_validation_error_without_detail(self, client, mock_api):
+        """Test that error bodies without 'detail' are reported as JSON."""
+        errors = {"name": ["Это поле обязательно."]}
+        mock_api.post("/scripts/script/").mock(return_value=Response(400, json=errors))
+
+        with pytest.raises(GimsApiError) as exc_info:
+            await client.create_script(name="")
+
+        assert json.loads(exc_info.value.detail) == errors
+        await client.close()
+
 
 class TestGimsClientReferences:
     """Tests for reference data client methods."""
@@ -258,6 +383,92 @@ class TestGimsClientReferences:
         assert result == sample_property_sections
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_reference_data_cached(self, client, mock_api, sample_value_types):
+        """Test that reference data is fetched once within the cache TTL."""
+        route = mock_api.get("/rest/value_types/").mock(return_value=Response(200, json=sample_value_types))
+
+        assert await client.list_value_types() == sample_value_types
+        assert await client.list_value_types() == sample_value_types
+
+        assert route.call_count == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_reference_cache_expires(self, client, mock_api, sample_value_types, monkeypatch):
+        """Test that reference data is refetched after the cache TTL."""
+        route = mock_api.get("/rest/value_types/").mock(return_value=Response(200, json=sample_value_types))
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        await client.list_value_types()
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + REFERENCE_CACHE_TTL + 1)
+        await client.list_value_types()
+
+        assert route.call_count == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_refs(self, client, mock_api, sample_value_types, sample_property_sections):
+        """Test that prefetching fills the reference cache."""
+        types_route = mock_api.get("/rest/value_types/").mock(return_value=Response(200, json=sample_value_types))
+        sections_route = mock_api.get("/rest/property_sections/").mock(
+            return_value=Response(200, json=sample_property_sections)
+        )
+
+        assert await client.prefetch_refs() == (sample_value_types, sample_property_sections)
+        await client.list_value_types()
+        await client.list_property_sections()
+
+        assert types_route.call_count == 1
+        assert sections_route.call_count == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_reference_cache(self, client, mock_api, sample_value_types):
+        """Test that invalidating the cache forces a refetch."""
+        route = mock_api.get("/rest/value_types/").mock(return_value=Response(200, json=sample_value_types))
+        await client.list_value_types()
+
+        client.invalidate_reference_cache()
+        await client.list_value_types()
+
+        assert route.call_count == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_datasource_types_cached_until_changed(self, client, mock_api, sample_datasource_types):
+        """Test that the type list is refetched after a type is changed, even if the change fails."""
+        route = mock_api.get("/datasource_types/ds_type/").mock(
+            return_value=Response(200, json=sample_datasource_types)
+        )
+        mock_api.delete("/datasource_types/ds_type/1/").mock(return_value=Response(500, json={"detail": "boom"}))
+
+        await client.list_datasource_types()
+        await client.list_datasource_types()
+        assert route.call_count == 1
+
+        with pytest.raises(GimsApiError):
+            await client.delete_datasource_type(1)
+        await client.list_datasource_types()
+        assert route.call_count == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_activator_type_folders_cached_until_changed(self, client, mock_api, sample_folders):
+        """Test that folder lists are shared briefly and refetched after a folder change."""
+        route = mock_api.get("/activator_type/folder/").mock(return_value=Response(200, json=sample_folders))
+        mock_api.post("/activator_type/folder/").mock(return_value=Response(201, json={"id": 9, "name": "new"}))
+
+        await client.list_activator_type_folders()
+        await client.list_activator_type_folders()
+        assert route.call_count == 1
+
+        await client.create_activator_type_folder("new")
+        await client.list_activator_type_folders()
+        assert route.call_count == 2
+        await client.close()
+
 
 class TestGimsClientResponseFiltering:
     """Tests for non-JSON response filtering."""
@@ -315,6 +526,21 @@ class TestGimsClientResponseFiltering:
         assert "<html>" not in exc_info.value.detail
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_large_html_page_detected_without_content_type(self, client, mock_api):
+        """Test that large HTML pages served as text/plain are still detected and filtered."""
+        html_content = "<!DOCTYPE html><html><head><title>Server Error (500)</title></head><body>"
+        html_content += "<pre>traceback line</pre>" * 100_000 + "</body></html>"
+        mock_api.get("/scripts/folder/").mock(
+            return_value=Response(500, content=html_content.encode(), headers={"content-type": "text/plain"})
+        )
+
+        with pytest.raises(GimsApiError) as exc_info:
+            await client.list_script_folders()
+
+        assert exc_info.value.detail == "Server returned HTML error page: Server Error (500)"
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_plain_text_truncated(self, client, mock_api):
         """Test that long plain text responses are truncated."""
@@ -353,6 +579,14 @@ class TestGimsClientResponseFiltering:
         assert "Failed to parse JSON" in exc_info.value.message
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_empty_body_returns_none(self, client, mock_api):
+        """Test that an empty success body is treated like 204 regardless of content-type."""
+        mock_api.delete("/scripts/script/1/").mock(return_value=Response(200, content=b""))
+
+        assert await client.delete_script(script_id=1) is None
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_valid_json_response_works(self, client, mock_api, sample_folders):
         """Test that valid JSON responses work correctly."""
@@ -368,3 +602,294 @@ class TestGimsClientResponseFiltering:
 
         assert result == sample_folders
         await client.close()
+
+
+class TestGimsClientLifecycle:
+    """Tests for HTTP client lifetime management."""
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self, config, mock_api, sample_folders):
+        """Test that the client can be used as an async context manager."""
+        mock_api.get("/scripts/folder/").mock(return_value=Response(200, json=sample_folders))
+
+        async with GimsClient(config) as client:
+            http_client = client._client
+            assert await client.list_script_folders() == sample_folders
+            assert client._client is http_client
+
+        assert client._client is None
+        assert http_client.is_closed
+
+    def test_ssl_context_respects_verify_ssl(self, config):
+        """Test that the SSL context built for the client honours verify_ssl."""
+        assert GimsClient(config)._ssl_context.verify_mode == ssl.CERT_REQUIRED
+        assert GimsClient(replace(config, verify_ssl=False))._ssl_context.verify_mode == ssl.CERT_NONE
+
+    def test_environment_proxies_respected(self, config, monkeypatch):
+        """Test that HTTPS_PROXY/NO_PROXY still apply alongside the custom transport."""
+        for name in ("https_proxy", "all_proxy", "no_proxy", "ALL_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:3128")
+        monkeypatch.setenv("NO_PROXY", "internal.local")
+
+        assert _environment_proxy("https://gims.test.local/automation") == "http://proxy.local:3128"
+        assert _environment_proxy("https://internal.local/automation") is None
+
+        client = GimsClient(config)
+        proxies = []
+        build_transport = client._build_transport
+        monkeypatch.setattr(
+            client, "_build_transport", lambda proxy=None: proxies.append(proxy) or build_transport(proxy)
+        )
+        client._build_client()
+        assert proxies == ["http://proxy.local:3128"]
+
+    @pytest.mark.asyncio
+    async def test_shared_client_reused(self, config, mock_api, sample_folders):
+        """Test that get_shared_client returns one client per configuration."""
+        mock_api.get("/scripts/folder/").mock(return_value=Response(200, json=sample_folders))
+
+        client = get_shared_client(config)
+        assert get_shared_client(config) is client
+        assert get_shared_client(replace(config)) is client
+        assert get_shared_client(replace(config, access_token="other")) is not client
+        assert get_shared_client(replace(config, verify_ssl=False)) is not client
+
+        await client.list_script_folders()
+        http_client = client._client
+        await close_shared_clients()
+
+        assert http_client.is_closed
+        assert get_shared_client(config) is not client
+        await close_shared_clients()
+
+
+class TestGimsClientConcurrency:
+    """Tests for bounding concurrent API requests."""
+
+    @pytest.mark.asyncio
+    async def test_requests_bounded_by_max_concurrency(self, config, mock_api, sample_folders):
+        """Test that no more than max_concurrency requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def respond(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Response(200, json=sample_folders)
+
+        mock_api.get("/scripts/folder/").mock(side_effect=respond)
+        client = GimsClient(replace(config, max_concurrency=2))
+
+        results = await asyncio.gather(*(client.list_script_folders() for _ in range(6)))
+
+        assert results == [sample_folders] * 6
+        assert peak == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_backoff_releases_concurrency_slot(self, config, mock_api, sample_folders, monkeypatch):
+        """Test that a request waiting to retry does not hold a concurrency slot."""
+        monkeypatch.setattr("gims_mcp.client.RETRY_BACKOFF", 0.2)
+        mock_api.get("/scripts/folder/").mock(side_effect=[Response(503), Response(200, json=sample_folders)])
+        mock_api.get("/scripts/script/").mock(return_value=Response(200, json=[]))
+        client = GimsClient(replace(config, max_concurrency=1))
+        finished = []
+
+        async def call(name, coro):
+            await coro
+            finished.append(name)
+
+        retried = asyncio.create_task(call("folders", client.list_script_folders()))
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(call("scripts", client.list_scripts()), timeout=0.1)
+        await retried
+
+        assert finished == ["scripts", "folders"]
+        await client.close()
+
+
+class TestGimsClientRequests:
+    """Tests for outgoing request encoding."""
+
+    @pytest.mark.asyncio
+    async def test_json_body_encoded(self, client, mock_api):
+        """Test that request bodies are sent as UTF-8 JSON."""
+        route = mock_api.post("/scripts/script/").mock(return_value=Response(201, json={"id": 1}))
+
+        await client.create_script(name="скрипт", code="print('привет')")
+
+        request = route.calls.last.request
+        assert request.headers["content-type"] == "application/json"
+        assert json.loads(request.content) == {"name": "скрипт", "code": "print('привет')"}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_update_omits_none_fields(self, client, mock_api):
+        """Test that None keyword arguments are left out of PATCH bodies."""
+        route = mock_api.patch("/activator_types/activator_type/1/").mock(return_value=Response(200, json={"id": 1}))
+
+        await client.update_activator_type(1, code="pass", description=None, version=None)
+
+        assert json.loads(route.calls.last.request.content) == {"code": "pass"}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_has_no_content_type(self, client, mock_api, sample_folders):
+        """Test that bodiless requests do not send a Content-Type header."""
+        route = mock_api.get("/scripts/folder/").mock(return_value=Response(200, json=sample_folders))
+
+        await client.list_script_folders()
+
+        assert "content-type" not in route.calls.last.request.headers
+        await client.close()
+
+
+class TestGimsClientRetries:
+    """Tests for retrying transient gateway errors."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Do not sleep between retries."""
+        monkeypatch.setattr("gims_mcp.client.RETRY_BACKOFF", 0)
+
+    @pytest.mark.asyncio
+    async def test_get_retried_on_gateway_error(self, client, mock_api, sample_folders):
+        """Test that idempotent requests are retried on 502/503/504."""
+        route = mock_api.get("/scripts/folder/").mock(
+            side_effect=[Response(502), Response(503), Response(200, json=sample_folders)]
+        )
+
+        result = await client.list_script_folders()
+
+        assert result == sample_folders
+        assert route.call_count == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted(self, client, mock_api):
+        """Test that the last gateway error is raised once retries run out."""
+        route = mock_api.get("/scripts/folder/").mock(return_value=Response(504))
+
+        with pytest.raises(GimsApiError) as exc_info:
+            await client.list_script_folders()
+
+        assert exc_info.value.status_code == 504
+        assert route.call_count == 1 + TRANSIENT_RETRIES
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried(self, client, mock_api):
+        """Test that non-idempotent requests are not retried."""
+        route = mock_api.post("/scripts/script/").mock(return_value=Response(502))
+
+        with pytest.raises(GimsApiError):
+            await client.create_script(name="test")
+
+        assert route.call_count == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_streamed_list_retried(self, client, mock_api, sample_scripts):
+        """Test that streamed list endpoints are retried on gateway errors."""
+        mock_api.get("/scripts/script/").mock(side_effect=[Response(503), Response(200, json=sample_scripts)])
+
+        result = await client.list_scripts()
+
+        assert result == sample_scripts
+        await client.close()
+
+
+class TestGimsClientSse:
+    """Tests for SSE log streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_sse_reuses_client(self, client):
+        """Test that SSE data lines are yielded and the stream client is reused."""
+        body = b": keepalive\ndata: {\"a\": 1}\n\ndata: {\"b\": 2}\n\n"
+        with respx.mock(base_url="https://gims.test.local") as sse_mock:
+            sse_mock.get("/logs/stream/").mock(
+                return_value=Response(200, content=body, headers={"content-type": "text/event-stream"})
+            )
+
+            first = [data async for data in client.stream_sse("/logs/stream/", timeout=10)]
+            sse_client = client._sse_client
+            second = [data async for data in client.stream_sse("/logs/stream/", timeout=10)]
+
+        assert first == second == [' {"a": 1}', ' {"b": 2}']
+        assert client._sse_client is sse_client
+
+        await client.close()
+        assert client._sse_client is None
+        assert sse_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_stream_sse_splits_lines_across_chunks(self, client):
+        """Test that data lines split across chunks, CRLF endings and a final unterminated line are handled."""
+
+        async def chunks():
+            for chunk in [b"data: {\"msg\": \"\xd0\xbf\xd1", b"\x80\xd0\xb8\"}\r\n: keep", b"alive\r\n\r\ndata: last"]:
+                yield chunk
+
+        with respx.mock(base_url="https://gims.test.local") as sse_mock:
+            sse_mock.get("/logs/stream/").mock(return_value=Response(200, content=chunks()))
+            result = [data async for data in client.stream_sse("/logs/stream/", timeout=10)]
+
+        assert result == [' {"msg": "при"}', " last"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_sse_stops_at_deadline(self, client, monkeypatch):
+        """Test that chunks arriving after the deadline are not yielded."""
+        # start, connection attempt, first chunk, second chunk (past the 10s deadline)
+        clock = iter([0.0, 1.0, 2.0, 11.0])
+        monkeypatch.setattr(time, "monotonic", lambda: next(clock, 11.0))
+
+        async def chunks():
+            yield b"data: early\n"
+            yield b"data: late\n"
+
+        with respx.mock(base_url="https://gims.test.local") as sse_mock:
+            sse_mock.get("/logs/stream/").mock(return_value=Response(200, content=chunks()))
+            result = [data async for data in client.stream_sse("/logs/stream/", timeout=10)]
+
+        assert result == [" early"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_sse_token_refresh(self, client):
+        """Test that the stream reconnects with the refreshed token after a 401."""
+        with respx.mock(base_url="https://gims.test.local") as sse_mock:
+            route = sse_mock.get("/logs/stream/").mock(
+                side_effect=[Response(401), Response(200, content=b"data: ok\n")]
+            )
+            sse_mock.post("/security/token/refresh/").mock(return_value=Response(200, json={"access": "new-token"}))
+
+            result = [data async for data in client.stream_sse("/logs/stream/", timeout=10)]
+
+        assert result == [" ok"]
+        request = route.calls.last.request
+        assert request.headers["Authorization"] == "Bearer new-token"
+        assert request.headers["Accept"] == "text/event-stream"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_sse_url_resolution(self, config):
+        """Test that relative URLs keep the GIMS URL path prefix and absolute URLs are used as is."""
+        client = GimsClient(replace(config, url="https://gims.test.local/gims"))
+        with respx.mock as sse_mock:
+            relative = sse_mock.get("https://gims.test.local/gims/logs/stream/").mock(
+                return_value=Response(200, content=b"data: relative\n")
+            )
+            absolute = sse_mock.get("https://logs.test.local/stream/").mock(
+                return_value=Response(200, content=b"data: absolute\n")
+            )
+
+            assert [d async for d in client.stream_sse("/logs/stream/", timeout=10)] == [" relative"]
+            assert [d async for d in client.stream_sse("https://logs.test.local/stream/", timeout=10)] == [" absolute"]
+
+        assert relative.called and absolute.called
+        await client.close()
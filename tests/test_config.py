@@ -1,5 +1,7 @@
 """Tests for configuration module."""
 
+import dataclasses
+
 import pytest
 
 from gims_mcp.config import Config, _parse_bool_env
@@ -88,6 +90,27 @@ class TestConfigFromArgs:
         )
         assert config.verify_ssl is True
 
+    def test_verify_ssl_cli_string(self, monkeypatch):
+        """Raw --verify-ssl string is parsed."""
+        monkeypatch.setenv("GIMS_VERIFY_SSL", "true")
+        config = Config.from_args(
+            url="https://example.com",
+            access_token="test-access-token",
+            refresh_token="test-refresh-token",
+            verify_ssl="Off",
+        )
+        assert config.verify_ssl is False
+
+    def test_verify_ssl_cli_invalid_string_raises(self):
+        """Unknown --verify-ssl string raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid --verify-ssl value 'maybe'"):
+            Config.from_args(
+                url="https://example.com",
+                access_token="test-access-token",
+                refresh_token="test-refresh-token",
+                verify_ssl="maybe",
+            )
+
     def test_missing_access_token_raises(self, monkeypatch):
         """Missing access token raises ValueError."""
         monkeypatch.delenv("GIMS_ACCESS_TOKEN", raising=False)
@@ -196,3 +219,15 @@ class TestMaxResponseSizeConfig:
             refresh_token="test-refresh-token",
         )
         assert config.max_response_size_kb == 15
+
+
+class TestConfigInstance:
+    """Tests for Config instance storage."""
+
+    def test_frozen_and_slotted(self):
+        """Config is immutable and stores fields in slots."""
+        config = Config(url="https://example.com", access_token="a", refresh_token="r")
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.url = "https://other.example.com"
+        assert dataclasses.replace(config, url="https://other.example.com").url == "https://other.example.com"
@@ -0,0 +1,44 @@
+"""Tests for command line entry point."""
+
+import pytest
+
+from gims_mcp.__main__ import _build_parser, _scan_args
+
+
+class TestScanArgs:
+    """Tests for the fast-path argument scanner."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--url", "https://gims.example.com"],
+            ["--url=https://gims.example.com", "--access-token", "a", "--refresh-token=r"],
+            ["--verify-ssl", "false", "--debug"],
+            ["--verify-ssl=On"],
+            ["--max-response-size", "20", "--log-stream-timeout", "120"],
+            ["--url", "first", "--url", "second"],
+            ["--verify-ssl", "maybe"],
+        ],
+    )
+    def test_matches_argparse(self, argv):
+        """Scanner produces the same namespace as the full parser."""
+        assert vars(_scan_args(argv)) == vars(_build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["-h"],
+            ["--help"],
+            ["--unknown", "x"],
+            ["--deb"],
+            ["--url"],
+            ["--url", "--debug"],
+            ["--max-response-size", "big"],
+            ["--debug=yes"],
+            ["positional"],
+        ],
+    )
+    def test_falls_back_to_argparse(self, argv):
+        """Help, unknown flags and invalid values are left to argparse."""
+        assert _scan_args(argv) is None
@@ -35,6 +35,13 @@ class TestSerializeScript:
         assert "exported_at" in meta
         assert code == 'print("hello")'
 
+    def test_shared_exported_at(self):
+        """Test that a batch timestamp is used instead of the current time."""
+        exported_at = "2026-01-20T10:00:00+00:00"
+        meta_yaml, _ = serialize_script({"name": "s", "code": ""}, "https://gims.test", exported_at=exported_at)
+
+        assert yaml.safe_load(meta_yaml)["exported_at"] == exported_at
+
     def test_script_with_description(self):
         """Test serialization preserves description."""
         script_data = {
@@ -167,6 +174,14 @@ class TestSerializeDatasourceType:
         assert len(params["parameters"]) == 1
         assert params["parameters"][0]["label"] == "timeout"
 
+    def test_empty_sections_match_yaml_dump(self):
+        """Test that empty properties and parameters are still written as YAML lists."""
+        files = serialize_datasource_type(
+            {"name": "T", "methods": [{"name": "M", "label": "m"}]}, "https://gims.test"
+        )
+        assert files["properties.yaml"] == yaml.dump({"properties": []}, default_flow_style=False)
+        assert files["methods/m/params.yaml"] == yaml.dump({"parameters": []}, default_flow_style=False)
+
 
 class TestSerializeActivatorType:
     """Tests for serialize_activator_type function."""
@@ -365,6 +380,19 @@ class TestDeserializeDatasourceType:
         assert result["methods"][0]["code"] == "result = execute(sql)"
         assert len(result["methods"][0]["parameters"]) == 1
 
+    def test_ignores_files_outside_method_folders(self):
+        """Test that only files inside methods/<label>/ define methods."""
+        files = {
+            "meta.yaml": yaml.dump({"name": "PostgreSQL"}),
+            "methods/README.md": "notes",
+            "docs/methods/x/meta.yaml": yaml.dump({"name": "X"}),
+            "methods/query/meta.yaml": yaml.dump({"name": "Query", "label": "query"}),
+        }
+
+        result = deserialize_datasource_type(files)
+
+        assert [m["label"] for m in result["methods"]] == ["query"]
+
     def test_empty_files(self):
         """Test deserialization with empty/missing files."""
         files = {}
@@ -403,6 +431,13 @@ class TestDeserializeActivatorType:
         result = deserialize_activator_type(files)
         assert result["code"] == "# No code"
 
+    def test_missing_yaml_files(self):
+        """Test that missing or empty YAML files deserialize as empty sections."""
+        result = deserialize_activator_type({"meta.yaml": "", "code.py": "pass"})
+        assert result["name"] == ""
+        assert result["version"] == "1.0"
+        assert result["properties"] == []
+
 
 class TestRoundTrip:
     """Tests for serialization/deserialization round-trips."""
@@ -0,0 +1,107 @@
+"""Tests for MCP server tool registration and dispatch."""
+
+import json
+
+import pytest
+from httpx import Response
+from mcp import types
+
+from gims_mcp.client import close_shared_clients
+from gims_mcp.server import _TOOL_MODULES, GimsMcpServer, _load_tool_module, _tool_handlers, _tool_list
+
+
+@pytest.fixture
+async def server(config):
+    """Create a test server, closing its shared API client afterwards."""
+    yield GimsMcpServer(config)
+    await close_shared_clients()
+
+
+async def _list_tools(server: GimsMcpServer) -> list[types.Tool]:
+    handler = server.server.request_handlers[types.ListToolsRequest]
+    result = await handler(types.ListToolsRequest(method="tools/list"))
+    return result.root.tools
+
+
+async def _call_tool(server: GimsMcpServer, name: str, arguments: dict) -> str:
+    handler = server.server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call", params=types.CallToolRequestParams(name=name, arguments=arguments)
+    )
+    result = await handler(request)
+    return result.root.content[0].text
+
+
+class TestToolRegistration:
+    """Tests for listing tools."""
+
+    def test_tool_modules_resolve(self):
+        """Test that every tool family names existing functions."""
+        for module, get_tools, handle_tool in _TOOL_MODULES:
+            loaded = _load_tool_module(module)
+            assert callable(getattr(loaded, get_tools))
+            assert callable(getattr(loaded, handle_tool))
+
+    @pytest.mark.asyncio
+    async def test_list_tools_includes_all_families(self, server):
+        """Test that tools from every family are listed once."""
+        names = [tool.name for tool in await _list_tools(server)]
+
+        assert len(names) == len(set(names))
+        for name in ("list_scripts", "list_datasource_types", "list_activator_types", "list_value_types",
+                     "get_script_execution_log", "validate_python_code"):
+            assert name in names
+
+    def test_every_tool_has_a_handler(self):
+        """Test that each family's tools are routed to that family's handler."""
+        handlers = _tool_handlers()
+        for module, get_tools, handle_tool in _TOOL_MODULES:
+            loaded = _load_tool_module(module)
+            for tool in getattr(loaded, get_tools)():
+                assert handlers[tool.name] is getattr(loaded, handle_tool)
+
+    @pytest.mark.asyncio
+    async def test_list_tools_serves_cached_definitions(self, server):
+        """Test that repeated list_tools requests return the cached definitions."""
+        cached = [t.name for t in _tool_list()]
+
+        assert [t.name for t in await _list_tools(server)] == cached
+        assert [t.name for t in await _list_tools(server)] == cached
+
+
+class TestServerLifecycle:
+    """Tests for server resource management."""
+
+    @pytest.mark.asyncio
+    async def test_client_created_on_first_use(self, server):
+        """Test that listing tools does not create the API client."""
+        await _list_tools(server)
+        assert server._client is None
+
+        client = server.client
+        assert server.client is client
+        await server.close()
+
+
+class TestToolDispatch:
+    """Tests for routing tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, server):
+        """Test that unknown tools are reported."""
+        assert await _call_tool(server, "no_such_tool", {}) == "Unknown tool: no_such_tool"
+
+    @pytest.mark.asyncio
+    async def test_dispatches_to_family(self, server):
+        """Test that a tool call reaches its family's handler."""
+        text = await _call_tool(server, "validate_python_code", {"code": "x = 1"})
+        assert json.loads(text)["valid"] is True
+
+    @pytest.mark.asyncio
+    async def test_api_error_reported(self, server, mock_api):
+        """Test that API errors are returned as text rather than raised."""
+        mock_api.get("/scripts/script/1/").mock(return_value=Response(404))
+
+        text = await _call_tool(server, "get_script", {"script_id": 1})
+
+        assert "Not found" in text
@@ -15,7 +15,13 @@ class TestGetActivatorTypeTools:
         """Test that get_activator_type_tools returns a list."""
         tools = get_activator_type_tools()
         assert isinstance(tools, list)
-        assert len(tools) == 15  # Including get_activator_type_code
+        assert len(tools) == 16  # Including get_activator_type_code and batch_execute_activator_type
+
+    def test_tools_built_once(self):
+        """Test that repeated calls share the Tool objects but not the list."""
+        first, second = get_activator_type_tools(), get_activator_type_tools()
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
 
     def test_all_tools_have_required_fields(self):
         """Test that all tools have name, description, and inputSchema."""
@@ -45,6 +51,7 @@ class TestGetActivatorTypeTools:
             "update_activator_type_property",
             "delete_activator_type_property",
             "search_activator_types",
+            "batch_execute_activator_type",
         }
         assert names == expected
 
@@ -105,6 +112,7 @@ class TestHandleActivatorTypeTool:
         assert result is not None
         data = json.loads(result[0].text)
         assert "types" in data
+        assert all("code" not in t for t in data["types"])
         await client.close()
 
     @pytest.mark.asyncio
@@ -252,6 +260,105 @@ class TestHandleActivatorTypeTool:
         assert "results" in data
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_search_activator_types_both(self, client, mock_api, sample_activator_types):
+        """Test that 'both' search fetches only types not matched by name, in catalog order."""
+        catalog = mock_api.get("/activator_types/activator_type/").mock(
+            return_value=Response(200, json=sample_activator_types)
+        )
+        # Type 1 already matches by name, so only type 2 is fetched (unmocked routes fail)
+        second = mock_api.get("/activator_types/activator_type/2/").mock(
+            return_value=Response(200, json={"id": 2, "name": "TriggerActivator", "code": "run_schedule()"})
+        )
+
+        result = await handle_activator_type_tool(
+            "search_activator_types", {"query": "schedule", "search_in": "both"}, client
+        )
+
+        data = json.loads(result[0].text)
+        assert [(r["id"], r["matched_in"]) for r in data["results"]] == [(1, "name"), (2, "code")]
+        assert all("code" not in r for r in data["results"])
+        assert catalog.call_count == 1
+        assert second.call_count == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_execute(self, client, mock_api, sample_activator_types):
+        """Test batch_execute_activator_type runs operations and reports each in order."""
+        mock_api.get("/activator_types/activator_type/1/").mock(
+            return_value=Response(200, json=sample_activator_types[0])
+        )
+        mock_api.delete("/activator_types/activator_type/2/").mock(return_value=Response(204))
+        mock_api.get("/activator_types/activator_type/3/").mock(
+            return_value=Response(404, json={"detail": "Not found."})
+        )
+
+        result = await handle_activator_type_tool(
+            "batch_execute_activator_type",
+            {
+                "operations": [
+                    {"tool": "get_activator_type_code", "arguments": {"type_id": 1}},
+                    {"tool": "delete_activator_type", "arguments": {"type_id": 2}},
+                    {"tool": "get_activator_type_code", "arguments": {"type_id": 3}},
+                    {"tool": "list_scripts"},
+                ],
+            },
+            client,
+        )
+
+        data = json.loads(result[0].text)
+        assert data["count"] == 4
+        ok_code, ok_delete, not_found, unknown = data["results"]
+        assert ok_code == {"index": 0, "tool": "get_activator_type_code", "status": "ok",
+                           "result": {"id": 1, "name": "ScheduleActivator", "code": "# schedule\npass"}}
+        assert ok_delete["result"] == "Activator type deleted successfully"
+        assert not_found["status"] == "error"
+        assert "Not found" in not_found["error"]
+        assert unknown["status"] == "error"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_stop_on_error(self, client, mock_api):
+        """Test that stop_on_error skips operations not yet started."""
+        mock_api.get("/activator_types/activator_type/3/").mock(
+            return_value=Response(404, json={"detail": "Not found."})
+        )
+
+        result = await handle_activator_type_tool(
+            "batch_execute_activator_type",
+            {
+                "operations": [
+                    {"tool": "get_activator_type_code", "arguments": {"type_id": 3}},
+                    {"tool": "delete_activator_type", "arguments": {"type_id": 2}},
+                ],
+                "stop_on_error": True,
+                "max_concurrent": 1,
+            },
+            client,
+        )
+
+        data = json.loads(result[0].text)
+        assert [r["status"] for r in data["results"]] == ["error", "skipped"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_null_max_concurrent(self, client, mock_api):
+        """Test that a null max_concurrent falls back to the default."""
+        mock_api.delete("/activator_types/activator_type/2/").mock(return_value=Response(204))
+
+        result = await handle_activator_type_tool(
+            "batch_execute_activator_type",
+            {
+                "operations": [{"tool": "delete_activator_type", "arguments": {"type_id": 2}}],
+                "max_concurrent": None,
+            },
+            client,
+        )
+
+        data = json.loads(result[0].text)
+        assert data["results"][0]["status"] == "ok"
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_unknown_tool_returns_none(self, client):
         """Test that unknown tool returns None."""
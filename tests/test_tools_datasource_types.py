@@ -17,6 +17,12 @@ class TestGetDatasourceTypeTools:
         assert isinstance(tools, list)
         assert len(tools) == 24  # Including get_datasource_type_method_code
 
+    def test_tools_built_once(self):
+        """Test that repeated calls share the Tool objects but not the list."""
+        first, second = get_datasource_type_tools(), get_datasource_type_tools()
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
     def test_all_tools_have_required_fields(self):
         """Test that all tools have name, description, and inputSchema."""
         tools = get_datasource_type_tools()
@@ -136,6 +142,55 @@ class TestHandleDatasourceTypeTool:
         assert "methods" in data
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_datasource_type_pairs_method_parameters(self, client, mock_api, sample_datasource_types):
+        """Test that concurrently fetched parameters stay attached to their own method."""
+        methods = [
+            {"id": 1, "name": "connect", "label": "connect", "code": "pass"},
+            {"id": 2, "name": "query", "label": "query", "code": "pass"},
+        ]
+        mock_api.get("/datasource_types/ds_type/1/").mock(
+            return_value=Response(200, json=sample_datasource_types[0])
+        )
+        mock_api.get("/datasource_types/method/").mock(return_value=Response(200, json=methods))
+        mock_api.get("/datasource_types/method_params/").mock(
+            side_effect=lambda request: Response(
+                200, json=[{"id": 10, "label": f"param_of_{request.url.params['method_id']}"}]
+            )
+        )
+
+        result = await handle_datasource_type_tool(
+            "get_datasource_type", {"type_id": 1, "include_properties": False}, client
+        )
+
+        data = json.loads(result[0].text)
+        assert "properties" not in data
+        assert [(m["label"], m["code"], m["parameters"][0]["label"]) for m in data["methods"]] == [
+            ("connect", "[FILTERED]", "param_of_1"),
+            ("query", "[FILTERED]", "param_of_2"),
+        ]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_handlers_share_http_client(self, client, mock_api, sample_folders, sample_datasource_types):
+        """Test that successive handler calls reuse one open HTTP client (and so its connection pool)."""
+        mock_api.get("/datasource_types/folder/").mock(return_value=Response(200, json=sample_folders))
+        mock_api.get("/datasource_types/ds_type/").mock(return_value=Response(200, json=sample_datasource_types))
+        mock_api.get("/datasource_types/ds_type/1/").mock(
+            return_value=Response(200, json=sample_datasource_types[0])
+        )
+        mock_api.get("/datasource_types/method/").mock(return_value=Response(200, json=[]))
+
+        await handle_datasource_type_tool("list_datasource_types", {}, client)
+        http_client = client._client
+        await handle_datasource_type_tool(
+            "get_datasource_type", {"type_id": 1, "include_properties": False}, client
+        )
+
+        assert client._client is http_client
+        assert not http_client.is_closed
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_get_datasource_type_without_properties_and_methods(self, client, mock_api, sample_datasource_types):
         """Test get_datasource_type tool with include_properties=False and include_methods=False."""
@@ -226,7 +281,7 @@ class TestHandleDatasourceTypeTool:
     @pytest.mark.asyncio
     async def test_list_datasource_type_methods(self, client, mock_api):
         """Test list_datasource_type_methods tool."""
-        methods = [{"id": 1, "name": "connect", "label": "connect", "mds_type_id": 1}]
+        methods = [{"id": 1, "name": "connect", "label": "connect", "mds_type_id": 1, "code": "pass"}]
         mock_api.get("/datasource_types/method/").mock(return_value=Response(200, json=methods))
 
         result = await handle_datasource_type_tool(
@@ -235,7 +290,7 @@ class TestHandleDatasourceTypeTool:
 
         assert result is not None
         data = json.loads(result[0].text)
-        assert "methods" in data
+        assert data["methods"] == [{"id": 1, "name": "connect", "label": "connect", "mds_type_id": 1}]
         await client.close()
 
     @pytest.mark.asyncio
@@ -326,6 +381,31 @@ class TestHandleDatasourceTypeTool:
         assert "results" in data
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_search_datasource_types_both(self, client, mock_api, sample_datasource_types):
+        """Test that 'both' search only fetches methods of types not matched by name."""
+        catalog = mock_api.get("/datasource_types/ds_type/").mock(
+            return_value=Response(200, json=sample_datasource_types)
+        )
+        methods_route = mock_api.get("/datasource_types/method/").mock(
+            side_effect=lambda request: Response(200, json=[{
+                "id": 10,
+                "name": "scrape",
+                "code": f"import prometheus_client  # type {request.url.params['mds_type_id']}",
+            }])
+        )
+
+        result = await handle_datasource_type_tool(
+            "search_datasource_types", {"query": "prometheus", "search_in": "both"}, client
+        )
+
+        data = json.loads(result[0].text)
+        assert [(r["id"], r["matched_in"]) for r in data["results"]] == [(2, "name"), (1, "code")]
+        assert data["results"][1]["matched_methods"] == [{"id": 10, "name": "scrape", "match_count": 1}]
+        assert catalog.call_count == 1
+        assert methods_route.call_count == 1
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_unknown_tool_returns_none(self, client):
         """Test that unknown tool returns None."""
@@ -1,11 +1,14 @@
 """Tests for utility functions."""
 
+import json
+
 import pytest
 
 from gims_mcp.utils import (
     build_folder_paths,
     build_item_paths,
     search_in_code,
+    compile_search_pattern,
     check_response_size,
     ResponseTooLargeError,
     DEFAULT_MAX_RESPONSE_SIZE,
@@ -109,6 +112,14 @@ class TestBuildItemPaths:
 class TestSearchInCode:
     """Tests for search_in_code function."""
 
+    def test_precompiled_pattern(self):
+        """Test that a precompiled pattern is used instead of compiling the query."""
+        items = [{"id": 1, "name": "Alpha", "code": "x = (1"}]
+        pattern = compile_search_pattern("(1", case_sensitive=False)
+
+        assert search_in_code(items, "ignored", pattern=pattern)[0]["match_count"] == 1
+        assert search_in_code(items, "ALPHA", code_field="name", pattern=compile_search_pattern("ALPHA"))
+
     def test_simple_search(self):
         """Test simple substring search."""
         items = [
@@ -211,6 +222,11 @@ class TestCheckResponseSize:
         assert '"id": 1' in result
         assert '"name": "test"' in result
 
+    def test_matches_stdlib_json_format(self):
+        """Test that the response text is formatted like json.dumps(indent=2)."""
+        data = {"name": "Проверка", "items": [1, 2.5, None, True, {}, []], "nested": {"a": {"b": "c"}}, 3: "int key"}
+        assert check_response_size(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
     def test_large_response_raises_error(self):
         """Test that large responses raise ResponseTooLargeError."""
         # Create data larger than DEFAULT_MAX_RESPONSE_SIZE (10KB)
@@ -223,6 +239,30 @@ class TestCheckResponseSize:
         assert exc_info.value.limit == DEFAULT_MAX_RESPONSE_SIZE
         assert "Response too large" in str(exc_info.value)
 
+    def test_stdlib_encoder_stops_at_limit(self, monkeypatch):
+        """Test that without orjson an oversized response is abandoned at the limit."""
+        monkeypatch.setattr("gims_mcp.utils.orjson", None)
+        # The set at the end cannot be encoded, so reaching it would raise TypeError
+        data = {"items": ["Проверка " * 10] * 100 + [{1, 2}]}
+
+        with pytest.raises(ResponseTooLargeError) as exc_info:
+            check_response_size(data, limit=1024)
+
+        assert exc_info.value.partial
+        assert exc_info.value.size > 1024
+        assert "over 1KB" in str(exc_info.value)
+
+    def test_stdlib_encoder_exact_limit(self, monkeypatch):
+        """Test that without orjson the text and byte count match json.dumps."""
+        monkeypatch.setattr("gims_mcp.utils.orjson", None)
+        data = {"text": "Привет мир", "items": [1, 2.5, None]}
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        size = len(expected.encode("utf-8"))
+
+        assert check_response_size(data, limit=size) == expected
+        with pytest.raises(ResponseTooLargeError):
+            check_response_size(data, limit=size - 1)
+
     def test_custom_limit(self):
         """Test that custom limit is respected."""
         data = {"data": "x" * 1000}